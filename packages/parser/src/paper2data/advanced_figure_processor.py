@@ -18,6 +18,7 @@ from typing import List, Dict, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from enum import Enum
+from collections import Counter
 import hashlib
 
 try:
@@ -699,6 +700,18 @@ class AdvancedFigureProcessor:
             # Find text references
             self._find_text_references(all_figures, document_text)
             
+            # Tally the processing summary in a single pass over the figures
+            type_counts = Counter()
+            with_captions = with_text = high_quality = 0
+            for fig in all_figures:
+                type_counts[fig.figure_type] += 1
+                if fig.caption is not None:
+                    with_captions += 1
+                if fig.contains_text:
+                    with_text += 1
+                if fig.image_analysis.quality == ImageQuality.HIGH:
+                    high_quality += 1
+            
             processing_time = time.time() - start_time
             
             result = {
@@ -708,13 +721,13 @@ class AdvancedFigureProcessor:
                 "total_captions": len(all_captions),
                 "processing_time": processing_time,
                 "processing_summary": {
-                    "graphs": len([f for f in all_figures if f.figure_type == FigureType.GRAPH]),
-                    "charts": len([f for f in all_figures if f.figure_type == FigureType.CHART]),
-                    "diagrams": len([f for f in all_figures if f.figure_type == FigureType.DIAGRAM]),
-                    "photos": len([f for f in all_figures if f.figure_type == FigureType.PHOTO]),
-                    "with_captions": len([f for f in all_figures if f.caption is not None]),
-                    "with_text": len([f for f in all_figures if f.contains_text]),
-                    "high_quality": len([f for f in all_figures if f.image_analysis.quality == ImageQuality.HIGH])
+                    "graphs": type_counts[FigureType.GRAPH],
+                    "charts": type_counts[FigureType.CHART],
+                    "diagrams": type_counts[FigureType.DIAGRAM],
+                    "photos": type_counts[FigureType.PHOTO],
+                    "with_captions": with_captions,
+                    "with_text": with_text,
+                    "high_quality": high_quality
                 }
             }
             
@@ -10,17 +10,17 @@ This module provides comprehensive bibliographic data processing including:
 """
 
 import re
-import json
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from collections import Counter
 from pathlib import Path
 import requests
 from urllib.parse import quote
 from datetime import datetime
 
-from .utils import get_logger, clean_text, ProcessingError
+from .utils import get_logger, clean_text, dumps_json, ProcessingError
 
 logger = get_logger(__name__)
 
@@ -61,30 +61,28 @@ class CitationQuality(Enum):
     POOR = "poor"
     INCOMPLETE = "incomplete"
 
-@dataclass
+@dataclass(slots=True)
 class BibliographicAuthor:
     """Represents an author in a bibliographic reference."""
     family_name: str
-    given_names: List[str] = field(default_factory=list)
-    initials: List[str] = field(default_factory=list)
+    # Parsed name parts are immutable tuples shared between references
+    given_names: Sequence[str] = ()
+    initials: Sequence[str] = ()
     suffix: Optional[str] = None
     orcid: Optional[str] = None
     normalized_name: str = ""
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Post-process author information."""
         if not self.normalized_name:
             self.normalized_name = self._normalize_name()
     
     def _normalize_name(self) -> str:
         """Normalize author name for comparison."""
-        name_parts = [self.family_name]
-        if self.given_names:
-            name_parts.extend(self.given_names)
-        elif self.initials:
-            name_parts.extend(self.initials)
-        
-        return " ".join(name_parts).lower().strip()
+        other_parts = self.given_names or self.initials
+        if not other_parts:
+            return self.family_name.lower().strip()
+        return " ".join((self.family_name, *other_parts)).lower().strip()
     
     def get_display_name(self, style: CitationStyle) -> str:
         """Get formatted name according to citation style."""
@@ -108,7 +106,28 @@ class BibliographicAuthor:
             else:
                 return self.family_name
 
-@dataclass
+# Formatted citations keyed by (style, BibliographicReference._citation_state())
+_FORMATTED_CITATION_CACHE: Dict[Tuple, str] = {}
+_MAX_FORMATTED_CITATIONS = 4096
+
+# Field validation patterns, compiled at import so quality scoring never pays
+# for pattern compilation or re-module cache lookups
+_VALID_DOI_PATTERN = re.compile(r'^10\.\d{4,}/[^\s]+$')
+_VALID_PAGE_RANGE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^\d+$',  # Single page
+    r'^\d+-\d+$',  # Page range
+    r'^\d+–\d+$',  # Page range with en-dash
+    r'^pp\.\s*\d+-\d+$',  # With pp. prefix
+))
+_VALID_URL_PATTERN = re.compile(r'^https?://[^\s]+$')
+_NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+_VALID_ISSN_PATTERN = re.compile(r'^\d{4}-\d{3}[\dX]$')
+_VALID_ARXIV_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^\d{4}\.\d{4,5}(v\d+)?$',  # New format
+    r'^[a-z-]+/\d{7}(v\d+)?$',  # Old format
+))
+
+@dataclass(slots=True)
 class BibliographicReference:
     """Comprehensive bibliographic reference."""
     # Core identification
@@ -160,7 +179,7 @@ class BibliographicReference:
     validation_status: str = "pending"
     cross_references: List[str] = field(default_factory=list)
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Post-process reference data."""
         if not self.parsed_text:
             self.parsed_text = self.raw_text
@@ -177,7 +196,7 @@ class BibliographicReference:
         content = f"{self.title}_{self.year}_{len(self.authors)}"
         return hashlib.md5(content.encode()).hexdigest()[:12]
     
-    def _calculate_quality_scores(self):
+    def _calculate_quality_scores(self) -> None:
         """Calculate reference quality scores."""
         # Completeness score
         total_fields = 15
@@ -235,54 +254,66 @@ class BibliographicReference:
     
     def _is_valid_doi(self, doi: str) -> bool:
         """Validate DOI format."""
-        pattern = r'^10\.\d{4,}/[^\s]+$'
-        return bool(re.match(pattern, doi.strip()))
+        return bool(_VALID_DOI_PATTERN.match(doi.strip()))
     
     def _is_valid_page_range(self, pages: str) -> bool:
         """Validate page range format."""
-        patterns = [
-            r'^\d+$',  # Single page
-            r'^\d+-\d+$',  # Page range
-            r'^\d+–\d+$',  # Page range with en-dash
-            r'^pp\.\s*\d+-\d+$',  # With pp. prefix
-        ]
-        return any(re.match(pattern, pages.strip()) for pattern in patterns)
+        pages = pages.strip()
+        return any(pattern.match(pages) for pattern in _VALID_PAGE_RANGE_PATTERNS)
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format."""
-        pattern = r'^https?://[^\s]+$'
-        return bool(re.match(pattern, url.strip()))
+        return bool(_VALID_URL_PATTERN.match(url.strip()))
     
     def _is_valid_isbn(self, isbn: str) -> bool:
         """Validate ISBN format."""
-        isbn = re.sub(r'[^\d]', '', isbn)  # Remove non-digits
+        isbn = _NON_DIGIT_PATTERN.sub('', isbn)  # Remove non-digits
         return len(isbn) in [10, 13]
     
     def _is_valid_issn(self, issn: str) -> bool:
         """Validate ISSN format."""
-        pattern = r'^\d{4}-\d{3}[\dX]$'
-        return bool(re.match(pattern, issn.strip()))
+        return bool(_VALID_ISSN_PATTERN.match(issn.strip()))
     
     def _is_valid_arxiv_id(self, arxiv_id: str) -> bool:
         """Validate arXiv ID format."""
-        patterns = [
-            r'^\d{4}\.\d{4,5}(v\d+)?$',  # New format
-            r'^[a-z-]+/\d{7}(v\d+)?$',  # Old format
-        ]
-        return any(re.match(pattern, arxiv_id.strip()) for pattern in patterns)
+        arxiv_id = arxiv_id.strip()
+        return any(pattern.match(arxiv_id) for pattern in _VALID_ARXIV_ID_PATTERNS)
     
     def get_formatted_citation(self, style: CitationStyle) -> str:
-        """Get formatted citation in specified style."""
+        """Get formatted citation in specified style.
+        
+        Formatted strings are memoized on the style plus a snapshot of every
+        field the formatters read, so a reference edited after formatting
+        (e.g. by the normalizer) is re-rendered rather than served stale.
+        """
         if style == CitationStyle.APA:
-            return self._format_apa()
+            formatter = self._format_apa
         elif style == CitationStyle.MLA:
-            return self._format_mla()
+            formatter = self._format_mla
         elif style == CitationStyle.IEEE:
-            return self._format_ieee()
+            formatter = self._format_ieee
         elif style == CitationStyle.CHICAGO:
-            return self._format_chicago()
+            formatter = self._format_chicago
         else:
             return self.parsed_text
+        
+        key = (style, self._citation_state())
+        formatted = _FORMATTED_CITATION_CACHE.get(key)
+        if formatted is None:
+            formatted = formatter()
+            if len(_FORMATTED_CITATION_CACHE) >= _MAX_FORMATTED_CITATIONS:
+                _FORMATTED_CITATION_CACHE.clear()
+            _FORMATTED_CITATION_CACHE[key] = formatted
+        return formatted
+    
+    def _citation_state(self) -> Tuple:
+        """Immutable snapshot of the fields used by the citation formatters."""
+        return (
+            self.title, self.journal, self.conference, self.year,
+            self.volume, self.issue, self.pages, self.doi,
+            tuple((author.family_name, tuple(author.given_names), tuple(author.initials))
+                  for author in self.authors),
+        )
     
     def _format_apa(self) -> str:
         """Format citation in APA style."""
@@ -450,39 +481,43 @@ class BibliographicDatabase:
     citation_network: Dict[str, List[str]] = field(default_factory=dict)
     style_distribution: Dict[CitationStyle, int] = field(default_factory=dict)
     quality_metrics: Dict[str, float] = field(default_factory=dict)
+    # Running per-column aggregates, so adding a reference does not rescan
+    # every reference added before it
+    _score_totals: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0], init=False, repr=False, compare=False)
+    _quality_counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
     
-    def add_reference(self, reference: BibliographicReference):
+    def add_reference(self, reference: BibliographicReference) -> None:
         """Add a reference to the database."""
         self.references.append(reference)
         self._update_style_distribution(reference.citation_style)
-        self._update_quality_metrics()
+        self._update_quality_metrics(reference)
     
-    def _update_style_distribution(self, style: CitationStyle):
+    def _update_style_distribution(self, style: CitationStyle) -> None:
         """Update citation style distribution."""
         if style not in self.style_distribution:
             self.style_distribution[style] = 0
         self.style_distribution[style] += 1
     
-    def _update_quality_metrics(self):
-        """Update overall quality metrics."""
-        if not self.references:
-            return
-        
-        total_completeness = sum(ref.completeness_score for ref in self.references)
-        total_accuracy = sum(ref.accuracy_score for ref in self.references)
-        total_confidence = sum(ref.confidence_score for ref in self.references)
+    def _update_quality_metrics(self, reference: BibliographicReference) -> None:
+        """Fold a newly added reference into the overall quality metrics."""
+        totals = self._score_totals
+        totals[0] += reference.completeness_score
+        totals[1] += reference.accuracy_score
+        totals[2] += reference.confidence_score
+        quality_counts = self._quality_counts
+        quality_counts[reference.quality] += 1
         
         count = len(self.references)
         self.quality_metrics = {
-            "average_completeness": total_completeness / count,
-            "average_accuracy": total_accuracy / count,
-            "average_confidence": total_confidence / count,
+            "average_completeness": totals[0] / count,
+            "average_accuracy": totals[1] / count,
+            "average_confidence": totals[2] / count,
             "total_references": count,
-            "excellent_quality": len([ref for ref in self.references if ref.quality == CitationQuality.EXCELLENT]),
-            "good_quality": len([ref for ref in self.references if ref.quality == CitationQuality.GOOD]),
-            "fair_quality": len([ref for ref in self.references if ref.quality == CitationQuality.FAIR]),
-            "poor_quality": len([ref for ref in self.references if ref.quality == CitationQuality.POOR]),
-            "incomplete_quality": len([ref for ref in self.references if ref.quality == CitationQuality.INCOMPLETE]),
+            "excellent_quality": quality_counts[CitationQuality.EXCELLENT],
+            "good_quality": quality_counts[CitationQuality.GOOD],
+            "fair_quality": quality_counts[CitationQuality.FAIR],
+            "poor_quality": quality_counts[CitationQuality.POOR],
+            "incomplete_quality": quality_counts[CitationQuality.INCOMPLETE],
         }
     
     def get_references_by_style(self, style: CitationStyle) -> List[BibliographicReference]:
@@ -500,112 +535,158 @@ class BibliographicDatabase:
         
         return max(self.style_distribution.items(), key=lambda x: x[1])[0]
 
+# Citation style indicator patterns
+_STYLE_PATTERNS = {
+    CitationStyle.APA: (
+        r'\([12]\d{3}\)',  # Year in parentheses
+        r'[A-Z][a-z]+,\s*[A-Z]\.',  # Last, F.
+        r'&\s+[A-Z][a-z]+',  # & Author
+        r'doi:\s*10\.',  # DOI format
+    ),
+    CitationStyle.MLA: (
+        r'"[^"]+"\.',  # Title in quotes
+        r'\*[^*]+\*',  # Italicized journal
+        r'vol\.\s*\d+',  # Volume format
+        r'pp\.\s*\d+-\d+',  # Page format
+    ),
+    CitationStyle.IEEE: (
+        r'\[\d+\]',  # Numbered citations
+        r'et\s+al\.',  # et al.
+        r'vol\.\s*\d+,\s*no\.\s*\d+',  # Volume, number format
+        r'pp\.\s*\d+-\d+,\s*[12]\d{3}',  # Pages, year
+    ),
+    CitationStyle.CHICAGO: (
+        r'[A-Z][a-z]+,\s*[A-Z][a-z]+',  # Last, First
+        r'\([12]\d{3}\):',  # Year with colon
+        r'no\.\s*\d+\s*\([12]\d{3}\)',  # Number (year)
+    ),
+    CitationStyle.NATURE: (
+        r'^[A-Z][a-z]+,\s*[A-Z]\.',  # Author format
+        r'Nature\s+\d+',  # Nature journal pattern
+        r'\(\d{4}\)',  # Year in parentheses
+    ),
+    CitationStyle.SCIENCE: (
+        r'^[A-Z]\.\s*[A-Z][a-z]+',  # F. Last format
+        r'Science\s+\d+',  # Science journal pattern
+        r'\(\d{4}\)',  # Year format
+    ),
+}
+
+# Compiled once at import; detect_style runs for every parsed reference
+_COMPILED_STYLE_PATTERNS = tuple(
+    (style, tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns))
+    for style, patterns in _STYLE_PATTERNS.items()
+)
+
 class CitationStyleDetector:
     """Detects citation styles from reference text."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         # Citation style patterns
-        self.style_patterns = {
-            CitationStyle.APA: [
-                r'\([12]\d{3}\)',  # Year in parentheses
-                r'[A-Z][a-z]+,\s*[A-Z]\.',  # Last, F.
-                r'&\s+[A-Z][a-z]+',  # & Author
-                r'doi:\s*10\.',  # DOI format
-            ],
-            CitationStyle.MLA: [
-                r'"[^"]+"\.',  # Title in quotes
-                r'\*[^*]+\*',  # Italicized journal
-                r'vol\.\s*\d+',  # Volume format
-                r'pp\.\s*\d+-\d+',  # Page format
-            ],
-            CitationStyle.IEEE: [
-                r'\[\d+\]',  # Numbered citations
-                r'et\s+al\.',  # et al.
-                r'vol\.\s*\d+,\s*no\.\s*\d+',  # Volume, number format
-                r'pp\.\s*\d+-\d+,\s*[12]\d{3}',  # Pages, year
-            ],
-            CitationStyle.CHICAGO: [
-                r'[A-Z][a-z]+,\s*[A-Z][a-z]+',  # Last, First
-                r'\([12]\d{3}\):',  # Year with colon
-                r'no\.\s*\d+\s*\([12]\d{3}\)',  # Number (year)
-            ],
-            CitationStyle.NATURE: [
-                r'^[A-Z][a-z]+,\s*[A-Z]\.',  # Author format
-                r'Nature\s+\d+',  # Nature journal pattern
-                r'\(\d{4}\)',  # Year in parentheses
-            ],
-            CitationStyle.SCIENCE: [
-                r'^[A-Z]\.\s*[A-Z][a-z]+',  # F. Last format
-                r'Science\s+\d+',  # Science journal pattern
-                r'\(\d{4}\)',  # Year format
-            ]
-        }
+        self.style_patterns = _STYLE_PATTERNS
+        self.compiled_style_patterns = _COMPILED_STYLE_PATTERNS
     
     def detect_style(self, reference_text: str) -> CitationStyle:
         """Detect citation style from reference text."""
-        scores = {}
-        
-        for style, patterns in self.style_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, reference_text, re.IGNORECASE))
-                score += matches
-            scores[style] = score
-        
-        # Return style with highest score
-        if scores:
-            max_score = max(scores.values())
-            if max_score > 0:
-                return max(scores.items(), key=lambda x: x[1])[0]
-        
-        return CitationStyle.UNKNOWN
+        best_style = CitationStyle.UNKNOWN
+        best_score = 0
+        
+        # Strict comparison keeps the first style on ties, as before
+        for style, patterns in self.compiled_style_patterns:
+            score = sum(len(pattern.findall(reference_text)) for pattern in patterns)
+            if score > best_score:
+                best_style, best_score = style, score
+        
+        return best_style
+
+# Reference field patterns, compiled once and shared by every ReferenceParser
+_AUTHOR_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+),\s*([A-Z]\.?\s*)+'),  # Last, F. M.
+    re.compile(r'([A-Z]\.?\s*)+\s+([A-Z][a-z]+)'),  # F. M. Last
+    re.compile(r'([A-Z][a-z]+),\s*([A-Z][a-z]+)'),  # Last, First
+)
+_INITIAL_PATTERN = re.compile(r'[A-Z]\.?')
+
+_TITLE_PATTERNS = (
+    re.compile(r'"([^"]+)"'),  # Title in quotes
+    re.compile(r'([A-Z][^.!?]*[.!?])'),  # Sentence case title
+)
+
+_JOURNAL_PATTERNS = (
+    re.compile(r'\*([^*]+)\*', re.IGNORECASE),  # Italicized journal
+    re.compile(r'([A-Z][A-Za-z\s&]+)(?:\s+\d+|\s+vol)', re.IGNORECASE),  # Journal before volume
+)
+
+_YEAR_PATTERNS = (
+    re.compile(r'\(([12]\d{3})\)'),  # Year in parentheses
+    re.compile(r'\b([12]\d{3})\b'),  # Year standalone
+)
+
+_DOI_PATTERN = re.compile(r'(?:doi:|DOI:)?\s*(10\.\d+/[^\s,]+)', re.IGNORECASE)
+_VOLUME_PATTERN = re.compile(r'(?:vol\.?\s*|volume\s*)(\d+)', re.IGNORECASE)
+_ISSUE_PATTERN = re.compile(r'(?:no\.?\s*|issue\s*|number\s*)(\d+)', re.IGNORECASE)
+_PAGES_PATTERN = re.compile(r'(?:pp\.?\s*|pages?\s*)(\d+(?:-|–)\d+|\d+)', re.IGNORECASE)
+_URL_PATTERN = re.compile(r'https?://[^\s,]+')
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_NUMBERED_PREFIX_PATTERN = re.compile(r'^\d+\.\s*')
+_BRACKETED_PREFIX_PATTERN = re.compile(r'^\[\d+\]\s*')
+
+# Bounds for the per-parser reference cache
+_MAX_CACHED_REFERENCES = 4096
+_MAX_CACHED_REFERENCE_LENGTH = 4096
 
 class ReferenceParser:
     """Parses bibliographic references into structured data."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.style_detector = CitationStyleDetector()
         
-        # Author parsing patterns
-        self.author_patterns = [
-            r'([A-Z][a-z]+),\s*([A-Z]\.?\s*)+',  # Last, F. M.
-            r'([A-Z]\.?\s*)+\s+([A-Z][a-z]+)',  # F. M. Last
-            r'([A-Z][a-z]+),\s*([A-Z][a-z]+)',  # Last, First
-        ]
-        
-        # Title patterns
-        self.title_patterns = [
-            r'"([^"]+)"',  # Title in quotes
-            r'([A-Z][^.!?]*[.!?])',  # Sentence case title
-        ]
-        
-        # Journal patterns
-        self.journal_patterns = [
-            r'\*([^*]+)\*',  # Italicized journal
-            r'([A-Z][A-Za-z\s&]+)(?:\s+\d+|\s+vol)',  # Journal before volume
-        ]
-        
-        # Year patterns
-        self.year_patterns = [
-            r'\(([12]\d{3})\)',  # Year in parentheses
-            r'\b([12]\d{3})\b',  # Year standalone
-        ]
-        
-        # DOI pattern
-        self.doi_pattern = r'(?:doi:|DOI:)?\s*(10\.\d+/[^\s,]+)'
-        
-        # Volume/Issue/Pages patterns
-        self.volume_pattern = r'(?:vol\.?\s*|volume\s*)(\d+)'
-        self.issue_pattern = r'(?:no\.?\s*|issue\s*|number\s*)(\d+)'
-        self.pages_pattern = r'(?:pp\.?\s*|pages?\s*)(\d+(?:-|–)\d+|\d+)'
-    
-    def parse_reference(self, reference_text: str, reference_id: str = None) -> BibliographicReference:
-        """Parse a reference into structured data."""
-        # Clean the reference text
+        # Field patterns (precompiled at module level)
+        self.author_patterns = _AUTHOR_PATTERNS
+        self.title_patterns = _TITLE_PATTERNS
+        self.journal_patterns = _JOURNAL_PATTERNS
+        self.year_patterns = _YEAR_PATTERNS
+        self.doi_pattern = _DOI_PATTERN
+        self.volume_pattern = _VOLUME_PATTERN
+        self.issue_pattern = _ISSUE_PATTERN
+        self.pages_pattern = _PAGES_PATTERN
+        
+        # Parsed fields keyed by cleaned reference body
+        self._parse_cache: Dict[str, Tuple] = {}
+    
+    def __reduce__(self) -> Tuple[Any, Tuple[()]]:
+        """Pickle as a fresh parser so worker processes start without the cache.
+        
+        Every other attribute is rebuilt from module-level patterns by
+        __init__, and this also works when the module is compiled and
+        instances have no __dict__.
+        """
+        return (self.__class__, ())
+    
+    def parse_reference(self, reference_text: str, reference_id: Optional[str] = None) -> BibliographicReference:
+        """Parse a reference into structured data.
+        
+        Field extraction is cached per cleaned reference body, so repeated
+        references (e.g. the same entry listed by several sections, or under
+        different list numbers) are only parsed once. A fresh
+        BibliographicReference and fresh authors are built on every call
+        because callers such as the normalizer mutate the returned objects;
+        only the immutable name tuples are shared.
+        """
+        # Clean the reference text; numbering and whitespace differences
+        # collapse onto the same cache entry
         cleaned_text = self._clean_reference_text(reference_text)
         
-        # Detect citation style
-        style = self.style_detector.detect_style(cleaned_text)
+        fields = self._parse_cache.get(cleaned_text)
+        if fields is None:
+            fields = self._parse_fields(cleaned_text)
+            if (len(cleaned_text) <= _MAX_CACHED_REFERENCE_LENGTH and
+                    len(self._parse_cache) < _MAX_CACHED_REFERENCES):
+                self._parse_cache[cleaned_text] = fields
+        
+        (style, authors, title, journal, year,
+         volume, issue, pages, doi, url) = fields
         
         # Create reference object
         reference = BibliographicReference(
@@ -615,30 +696,56 @@ class ReferenceParser:
             citation_style=style
         )
         
-        # Parse components
-        reference.authors = self._parse_authors(cleaned_text)
-        reference.title = self._parse_title(cleaned_text)
-        reference.journal = self._parse_journal(cleaned_text)
-        reference.year = self._parse_year(cleaned_text)
-        reference.volume = self._parse_volume(cleaned_text)
-        reference.issue = self._parse_issue(cleaned_text)
-        reference.pages = self._parse_pages(cleaned_text)
-        reference.doi = self._parse_doi(cleaned_text)
-        reference.url = self._parse_url(cleaned_text)
+        # Fill in parsed components
+        reference.authors = [
+            BibliographicAuthor(family_name=family_name, given_names=given_names, initials=initials)
+            for family_name, given_names, initials in authors
+        ]
+        reference.title = title
+        reference.journal = journal
+        reference.year = year
+        reference.volume = volume
+        reference.issue = issue
+        reference.pages = pages
+        reference.doi = doi
+        reference.url = url
         
         # Determine reference type
         reference.reference_type = self._determine_reference_type(reference)
         
         return reference
     
+    def _parse_fields(self, cleaned_text: str) -> Tuple:
+        """Extract the immutable parsed fields of a cleaned reference."""
+        # Detect citation style
+        style = self.style_detector.detect_style(cleaned_text)
+        
+        # Parse components
+        authors = tuple(
+            (author.family_name, author.given_names, author.initials)
+            for author in self._parse_authors(cleaned_text)
+        )
+        return (
+            style,
+            authors,
+            self._parse_title(cleaned_text),
+            self._parse_journal(cleaned_text),
+            self._parse_year(cleaned_text),
+            self._parse_volume(cleaned_text),
+            self._parse_issue(cleaned_text),
+            self._parse_pages(cleaned_text),
+            self._parse_doi(cleaned_text),
+            self._parse_url(cleaned_text),
+        )
+    
     def _clean_reference_text(self, text: str) -> str:
         """Clean and normalize reference text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_PATTERN.sub(' ', text.strip())
         
         # Remove numbered prefixes
-        text = re.sub(r'^\d+\.\s*', '', text)
-        text = re.sub(r'^\[\d+\]\s*', '', text)
+        text = _NUMBERED_PREFIX_PATTERN.sub('', text)
+        text = _BRACKETED_PREFIX_PATTERN.sub('', text)
         
         return text
     
@@ -648,22 +755,21 @@ class ReferenceParser:
         
         # Try different author patterns
         for pattern in self.author_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+            for match in pattern.finditer(text):
                 if len(match.groups()) >= 2:
                     family_name = match.group(1).strip()
                     given_part = match.group(2).strip()
                     
                     # Parse given names/initials
-                    given_names = []
-                    initials = []
+                    given_names: Tuple[str, ...] = ()
+                    initials: Tuple[str, ...] = ()
                     
                     if '.' in given_part:
                         # Initials
-                        initials = re.findall(r'[A-Z]\.?', given_part)
+                        initials = tuple(_INITIAL_PATTERN.findall(given_part))
                     else:
                         # Full given names
-                        given_names = given_part.split()
+                        given_names = tuple(given_part.split())
                     
                     author = BibliographicAuthor(
                         family_name=family_name,
@@ -685,7 +791,7 @@ class ReferenceParser:
     def _parse_title(self, text: str) -> str:
         """Parse title from reference text."""
         for pattern in self.title_patterns:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 title = match.group(1).strip()
                 if len(title) > 10:  # Reasonable title length
@@ -696,7 +802,7 @@ class ReferenceParser:
     def _parse_journal(self, text: str) -> str:
         """Parse journal name from reference text."""
         for pattern in self.journal_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 journal = match.group(1).strip()
                 if len(journal) > 3:  # Reasonable journal name length
@@ -707,7 +813,7 @@ class ReferenceParser:
     def _parse_year(self, text: str) -> Optional[int]:
         """Parse publication year from reference text."""
         for pattern in self.year_patterns:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 try:
                     year = int(match.group(1))
@@ -720,28 +826,35 @@ class ReferenceParser:
     
     def _parse_volume(self, text: str) -> str:
         """Parse volume from reference text."""
-        match = re.search(self.volume_pattern, text, re.IGNORECASE)
+        match = self.volume_pattern.search(text)
         return match.group(1) if match else ""
     
     def _parse_issue(self, text: str) -> str:
         """Parse issue from reference text."""
-        match = re.search(self.issue_pattern, text, re.IGNORECASE)
+        match = self.issue_pattern.search(text)
         return match.group(1) if match else ""
     
     def _parse_pages(self, text: str) -> str:
         """Parse pages from reference text."""
-        match = re.search(self.pages_pattern, text, re.IGNORECASE)
+        match = self.pages_pattern.search(text)
         return match.group(1) if match else ""
     
     def _parse_doi(self, text: str) -> str:
         """Parse DOI from reference text."""
-        match = re.search(self.doi_pattern, text, re.IGNORECASE)
+        # Every DOI starts with "10.", so a substring scan rejects most
+        # references outright and lets the regex start at the first candidate
+        start = text.find("10.")
+        if start < 0:
+            return ""
+        match = self.doi_pattern.search(text, start)
         return match.group(1) if match else ""
     
     def _parse_url(self, text: str) -> str:
         """Parse URL from reference text."""
-        url_pattern = r'https?://[^\s,]+'
-        match = re.search(url_pattern, text)
+        start = text.find("http")
+        if start < 0:
+            return ""
+        match = _URL_PATTERN.search(text, start)
         return match.group(0) if match else ""
     
     def _determine_reference_type(self, reference: BibliographicReference) -> ReferenceType:
@@ -750,21 +863,29 @@ class ReferenceParser:
             return ReferenceType.JOURNAL_ARTICLE
         elif reference.conference:
             return ReferenceType.CONFERENCE_PAPER
-        elif 'thesis' in reference.title.lower() or 'dissertation' in reference.title.lower():
+
+        title_lower = reference.title.lower()
+        if 'thesis' in title_lower or 'dissertation' in title_lower:
             return ReferenceType.THESIS
         elif reference.url and not reference.journal:
             return ReferenceType.WEBSITE
         elif reference.arxiv_id:
             return ReferenceType.PREPRINT
-        elif 'patent' in reference.title.lower():
+        elif 'patent' in title_lower:
             return ReferenceType.PATENT
         else:
             return ReferenceType.UNKNOWN
 
+# Normalizer patterns
+_DOI_PREFIX_PATTERN = re.compile(r'^(?:doi:|DOI:)?\s*')
+_DOI_URL_PREFIX_PATTERN = re.compile(r'^https?://(?:dx\.)?doi\.org/')
+_PAGES_PREFIX_PATTERN = re.compile(r'^pp\.?\s*')
+_DASH_TRANSLATION = str.maketrans({'–': '-', '—': '-'})
+
 class BibliographicNormalizer:
     """Normalizes bibliographic data across different styles."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.journal_aliases = self._load_journal_aliases()
         self.publisher_aliases = self._load_publisher_aliases()
     
@@ -846,23 +967,40 @@ class BibliographicNormalizer:
     def _normalize_doi(self, doi: str) -> str:
         """Normalize DOI format."""
         # Remove common prefixes
-        doi = re.sub(r'^(?:doi:|DOI:)?\s*', '', doi)
+        doi = _DOI_PREFIX_PATTERN.sub('', doi)
         
         # Remove URL prefix if present
-        doi = re.sub(r'^https?://(?:dx\.)?doi\.org/', '', doi)
+        doi = _DOI_URL_PREFIX_PATTERN.sub('', doi)
         
         return doi.strip()
     
     def _normalize_pages(self, pages: str) -> str:
         """Normalize page format."""
         # Remove 'pp.' prefix
-        pages = re.sub(r'^pp\.?\s*', '', pages)
+        pages = _PAGES_PREFIX_PATTERN.sub('', pages)
         
         # Normalize dash types
-        pages = re.sub(r'[–—]', '-', pages)
+        pages = pages.translate(_DASH_TRANSLATION)
         
         return pages.strip()
 
+# Reference section and entry patterns, compiled once with the flags they are
+# always used with
+_REFERENCE_SECTION_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)references?\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
+    r'(?i)bibliography\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
+    r'(?i)works?\s+cited\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
+    r'(?i)literature\s+cited\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
+))
+
+_REFERENCE_ENTRY_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'^\d+\.\s*(.+?)(?=\n\d+\.|\n\n|\Z)',  # Numbered references
+    r'^\[\d+\]\s*(.+?)(?=\n\[\d+\]|\n\n|\Z)',  # Bracketed numbers
+    r'^([A-Z][^.]+\.\s*.+?)(?=\n[A-Z][^.]+\.|\n\n|\Z)',  # Author-year
+))
+
+_CITE_KEY_WORD_PATTERN = re.compile(r'\b[A-Za-z]+\b')
+
 class BibliographicParser:
     """Main bibliographic parser class."""
     
@@ -872,19 +1010,9 @@ class BibliographicParser:
         self.normalizer = BibliographicNormalizer()
         self.database = BibliographicDatabase()
         
-        # Reference extraction patterns
-        self.reference_section_patterns = [
-            r'(?i)references?\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
-            r'(?i)bibliography\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
-            r'(?i)works?\s+cited\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
-            r'(?i)literature\s+cited\s*:?\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+:|\Z)',
-        ]
-        
-        self.reference_patterns = [
-            r'^\d+\.\s*(.+?)(?=\n\d+\.|\n\n|\Z)',  # Numbered references
-            r'^\[\d+\]\s*(.+?)(?=\n\[\d+\]|\n\n|\Z)',  # Bracketed numbers
-            r'^([A-Z][^.]+\.\s*.+?)(?=\n[A-Z][^.]+\.|\n\n|\Z)',  # Author-year
-        ]
+        # Reference extraction patterns (precompiled at module level)
+        self.reference_section_patterns = _REFERENCE_SECTION_PATTERNS
+        self.reference_patterns = _REFERENCE_ENTRY_PATTERNS
     
     def parse_bibliography(self, text: str) -> BibliographicDatabase:
         """Parse bibliography from text and return structured database."""
@@ -914,8 +1042,7 @@ class BibliographicParser:
         sections = []
         
         for pattern in self.reference_section_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
-            for match in matches:
+            for match in pattern.finditer(text):
                 section_text = match.group(1).strip()
                 if section_text and len(section_text) > 50:  # Reasonable section length
                     sections.append(section_text)
@@ -924,17 +1051,16 @@ class BibliographicParser:
     
     def _parse_reference_section(self, section_text: str) -> List[BibliographicReference]:
         """Parse individual references from a reference section."""
-        references = []
+        references: List[BibliographicReference] = []
+        
+        parse_reference = self.reference_parser.parse_reference
         
         # Try different reference patterns
         for pattern in self.reference_patterns:
-            matches = re.finditer(pattern, section_text, re.MULTILINE | re.DOTALL)
-            for i, match in enumerate(matches):
+            for match in pattern.finditer(section_text):
                 ref_text = match.group(1).strip()
                 if len(ref_text) > 20:  # Reasonable reference length
-                    ref_id = f"ref_{len(references) + 1:03d}"
-                    reference = self.reference_parser.parse_reference(ref_text, ref_id)
-                    references.append(reference)
+                    references.append(parse_reference(ref_text, f"ref_{len(references) + 1:03d}"))
         
         # If no structured patterns found, try line-by-line
         if not references:
@@ -950,18 +1076,19 @@ class BibliographicParser:
     
     def export_bibliography(self, format: str = "json") -> str:
         """Export bibliography in specified format."""
-        if format.lower() == "json":
+        format_lower = format.lower()
+        if format_lower == "json":
             return self._export_json()
-        elif format.lower() == "bibtex":
+        elif format_lower == "bibtex":
             return self._export_bibtex()
-        elif format.lower() == "ris":
+        elif format_lower == "ris":
             return self._export_ris()
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
     def _export_json(self) -> str:
         """Export bibliography as JSON."""
-        data = {
+        data: Dict[str, Any] = {
             "metadata": {
                 "total_references": len(self.database.references),
                 "dominant_style": self.database.get_dominant_citation_style().value,
@@ -980,80 +1107,78 @@ class BibliographicParser:
             ref_dict["extraction_date"] = ref.extraction_date.isoformat()
             data["references"].append(ref_dict)
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # orjson-backed when available; same indented layout as json.dumps
+        return dumps_json(data).decode('utf-8')
     
     def _export_bibtex(self) -> str:
         """Export bibliography as BibTeX."""
-        bibtex_entries = []
-        
+        return "".join(self._iter_bibtex_entries())
+    
+    def _iter_bibtex_entries(self) -> Iterator[str]:
+        """Yield one complete BibTeX entry per reference."""
         for ref in self.database.references:
             entry_type = self._get_bibtex_entry_type(ref.reference_type)
             cite_key = self._generate_cite_key(ref)
             
-            entry = f"@{entry_type}{{{cite_key},\n"
-            
-            # Add fields
+            fields: List[Tuple[str, Any]] = []
             if ref.title:
-                entry += f"  title = {{{ref.title}}},\n"
+                fields.append(("title", ref.title))
             if ref.authors:
-                author_str = " and ".join([f"{author.family_name}, {' '.join(author.given_names)}" 
-                                         for author in ref.authors])
-                entry += f"  author = {{{author_str}}},\n"
+                fields.append(("author", " and ".join([f"{author.family_name}, {' '.join(author.given_names)}"
+                                                       for author in ref.authors])))
             if ref.journal:
-                entry += f"  journal = {{{ref.journal}}},\n"
+                fields.append(("journal", ref.journal))
             if ref.year:
-                entry += f"  year = {{{ref.year}}},\n"
+                fields.append(("year", ref.year))
             if ref.volume:
-                entry += f"  volume = {{{ref.volume}}},\n"
+                fields.append(("volume", ref.volume))
             if ref.issue:
-                entry += f"  number = {{{ref.issue}}},\n"
+                fields.append(("number", ref.issue))
             if ref.pages:
-                entry += f"  pages = {{{ref.pages}}},\n"
+                fields.append(("pages", ref.pages))
             if ref.doi:
-                entry += f"  doi = {{{ref.doi}}},\n"
+                fields.append(("doi", ref.doi))
             if ref.url:
-                entry += f"  url = {{{ref.url}}},\n"
+                fields.append(("url", ref.url))
             
-            entry = entry.rstrip(',\n') + "\n}\n\n"
-            bibtex_entries.append(entry)
-        
-        return "".join(bibtex_entries)
+            field_lines = "".join(f",\n  {name} = {{{value}}}" for name, value in fields)
+            yield f"@{entry_type}{{{cite_key}{field_lines}\n}}\n\n"
     
     def _export_ris(self) -> str:
         """Export bibliography as RIS format."""
-        ris_entries = []
-        
+        return "".join(self._iter_ris_entries())
+    
+    def _iter_ris_entries(self) -> Iterator[str]:
+        """Yield one complete RIS record per reference."""
         for ref in self.database.references:
-            entry = f"TY  - {self._get_ris_type(ref.reference_type)}\n"
+            lines = [f"TY  - {self._get_ris_type(ref.reference_type)}\n"]
             
             if ref.title:
-                entry += f"TI  - {ref.title}\n"
+                lines.append(f"TI  - {ref.title}\n")
             
             for author in ref.authors:
                 if author.given_names:
-                    entry += f"AU  - {author.family_name}, {' '.join(author.given_names)}\n"
+                    lines.append(f"AU  - {author.family_name}, {' '.join(author.given_names)}\n")
                 else:
-                    entry += f"AU  - {author.family_name}\n"
+                    lines.append(f"AU  - {author.family_name}\n")
             
             if ref.journal:
-                entry += f"JO  - {ref.journal}\n"
+                lines.append(f"JO  - {ref.journal}\n")
             if ref.year:
-                entry += f"PY  - {ref.year}\n"
+                lines.append(f"PY  - {ref.year}\n")
             if ref.volume:
-                entry += f"VL  - {ref.volume}\n"
+                lines.append(f"VL  - {ref.volume}\n")
             if ref.issue:
-                entry += f"IS  - {ref.issue}\n"
+                lines.append(f"IS  - {ref.issue}\n")
             if ref.pages:
-                entry += f"SP  - {ref.pages}\n"
+                lines.append(f"SP  - {ref.pages}\n")
             if ref.doi:
-                entry += f"DO  - {ref.doi}\n"
+                lines.append(f"DO  - {ref.doi}\n")
             if ref.url:
-                entry += f"UR  - {ref.url}\n"
+                lines.append(f"UR  - {ref.url}\n")
             
-            entry += "ER  - \n\n"
-            ris_entries.append(entry)
-        
-        return "".join(ris_entries)
+            lines.append("ER  - \n\n")
+            yield "".join(lines)
     
     def _get_bibtex_entry_type(self, ref_type: ReferenceType) -> str:
         """Get BibTeX entry type for reference type."""
@@ -1094,7 +1219,7 @@ class BibliographicParser:
         
         # Clean title words
         if ref.title:
-            title_words = re.findall(r'\b[A-Za-z]+\b', ref.title.lower())
+            title_words = _CITE_KEY_WORD_PATTERN.findall(ref.title.lower())
             title_part = title_words[0] if title_words else "unknown"
         else:
             title_part = "unknown"
@@ -1103,20 +1228,21 @@ class BibliographicParser:
     
     def get_parsing_summary(self) -> Dict[str, Any]:
         """Get summary of parsing results."""
+        references = self.database.references
+        
+        # One pass over the references instead of one filter per enum member
+        quality_counts = Counter(ref.quality for ref in references)
+        type_counts = Counter(ref.reference_type for ref in references)
+        
         return {
-            "total_references": len(self.database.references),
+            "total_references": len(references),
             "citation_styles": {style.value: count for style, count in self.database.style_distribution.items()},
             "dominant_style": self.database.get_dominant_citation_style().value,
             "quality_distribution": {
-                "excellent": len(self.database.get_references_by_quality(CitationQuality.EXCELLENT)),
-                "good": len(self.database.get_references_by_quality(CitationQuality.GOOD)),
-                "fair": len(self.database.get_references_by_quality(CitationQuality.FAIR)),
-                "poor": len(self.database.get_references_by_quality(CitationQuality.POOR)),
-                "incomplete": len(self.database.get_references_by_quality(CitationQuality.INCOMPLETE)),
+                quality.value: quality_counts[quality] for quality in CitationQuality
             },
             "reference_types": {
-                ref_type.value: len([ref for ref in self.database.references if ref.reference_type == ref_type])
-                for ref_type in ReferenceType
+                ref_type.value: type_counts[ref_type] for ref_type in ReferenceType
             },
             "quality_metrics": self.database.quality_metrics,
         }
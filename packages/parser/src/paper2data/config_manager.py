@@ -7,10 +7,11 @@ file handling.
 """
 
 import os
+import copy
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 from dataclasses import dataclass
 
 from .config_schema import Paper2DataConfig, CONFIG_PROFILES
@@ -29,6 +30,7 @@ from .config_validator import (
     validate_config,
     get_validation_report
 )
+from .utils import YAMLSafeLoader
 
 
 @dataclass
@@ -59,6 +61,9 @@ class ConfigManager:
             Path.home() / ".config" / "paper2data" / "config.yml",
             Path.home() / ".config" / "paper2data" / "config.yaml"
         ]
+        # Parsed configuration files keyed by (path, mtime) so repeated loads
+        # of an unchanged file skip YAML parsing
+        self._file_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
     
     def load_config(
         self,
@@ -105,9 +110,14 @@ class ConfigManager:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r', encoding='utf-8') as f:
+        cache_key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        cached = self._file_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        with open(config_path, 'rb') as f:
             if config_path.suffix.lower() in ['.yml', '.yaml']:
-                config_dict = yaml.safe_load(f) or {}
+                config_dict = yaml.load(f, Loader=YAMLSafeLoader) or {}
             elif config_path.suffix.lower() == '.json':
                 config_dict = json.load(f) or {}
             else:
@@ -124,6 +134,7 @@ class ConfigManager:
             if key in valid_fields:
                 filtered_config[key] = value
         
+        self._file_cache[cache_key] = copy.deepcopy(filtered_config)
         return filtered_config
     
     def _find_and_load_config(self) -> Dict[str, Any]:
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from pydantic import ValidationError as PydanticValidationError
 from .config_schema import Paper2DataConfig, CONFIG_PROFILES
 from .smart_defaults import smart_defaults
+from .utils import YAMLSafeLoader
 
 
 @dataclass
@@ -110,9 +111,9 @@ class ConfigValidator:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
+        with open(path, 'rb') as f:
             if path.suffix.lower() in ['.yml', '.yaml']:
-                config_dict = yaml.safe_load(f)
+                config_dict = yaml.load(f, Loader=YAMLSafeLoader)
             elif path.suffix.lower() == '.json':
                 import json
                 config_dict = json.load(f)
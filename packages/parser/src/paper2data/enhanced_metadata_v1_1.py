@@ -10,8 +10,8 @@ This module provides advanced metadata extraction capabilities including:
 """
 
 import re
-import json
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
@@ -19,7 +19,7 @@ from pathlib import Path
 import requests
 from urllib.parse import quote
 
-from .utils import get_logger, clean_text, ProcessingError
+from .utils import get_logger, clean_text, dumps_json, ProcessingError
 
 logger = get_logger(__name__)
 
@@ -50,6 +50,97 @@ class FundingSourceType(Enum):
     INTERNATIONAL = "international"
     UNKNOWN = "unknown"
 
+# Normalization patterns shared by the metadata dataclasses, compiled once at
+# import since they run for every author, institution and funding source
+_ORCID_PATTERN = re.compile(r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$')
+_INSTITUTION_PREFIX_PATTERN = re.compile(r'\b(University of|College of|Institute of|School of)\b', re.IGNORECASE)
+_INSTITUTION_SUFFIX_PATTERN = re.compile(r'\b(University|College|Institute|School|Lab|Laboratory)\b', re.IGNORECASE)
+# Titles and suffixes in one alternation, so author names are scanned once
+_AUTHOR_TITLE_SUFFIX_PATTERN = re.compile(
+    r'\b(?:Dr|Prof|Professor|PhD|Ph\.D|MD|M\.D'  # Titles
+    r'|Jr|Sr|III|IV|V)\b\.?',  # Suffixes
+    re.IGNORECASE,
+)
+_FUNDING_NAME_PATTERN = re.compile(r'\b(Foundation|Fund|Agency|Council|Institute|Organization)\b', re.IGNORECASE)
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# The same names recur across authors, papers and batches, so the pure
+# normalization and classification helpers are memoized on their input string
+_NORMALIZATION_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_NORMALIZATION_CACHE_SIZE)
+def _normalize_institution_name(name: str) -> str:
+    """Normalize institution name for comparison."""
+    # Remove common prefixes/suffixes
+    name = _INSTITUTION_PREFIX_PATTERN.sub('', name)
+    name = _INSTITUTION_SUFFIX_PATTERN.sub('', name)
+    
+    # Remove punctuation and normalize spaces
+    name = _PUNCTUATION_PATTERN.sub('', name)
+    return _WHITESPACE_PATTERN.sub(' ', name).strip().lower()
+
+@lru_cache(maxsize=_NORMALIZATION_CACHE_SIZE)
+def _normalize_author_name(name: str) -> str:
+    """Normalize author name for comparison."""
+    # Remove titles and suffixes
+    name = _AUTHOR_TITLE_SUFFIX_PATTERN.sub('', name)
+    
+    # Normalize spaces and case
+    return _WHITESPACE_PATTERN.sub(' ', name).strip().lower()
+
+@lru_cache(maxsize=_NORMALIZATION_CACHE_SIZE)
+def _normalize_funding_name(name: str) -> str:
+    """Normalize funding source name."""
+    # Remove common patterns
+    name = _FUNDING_NAME_PATTERN.sub('', name)
+    name = _PUNCTUATION_PATTERN.sub('', name)
+    return _WHITESPACE_PATTERN.sub(' ', name).strip().lower()
+
+@lru_cache(maxsize=_NORMALIZATION_CACHE_SIZE)
+def _classify_institution_name(inst_name: str) -> InstitutionType:
+    """Classify institution type based on name."""
+    inst_lower = inst_name.lower()
+    
+    if any(word in inst_lower for word in ['university', 'college', 'school']):
+        return InstitutionType.UNIVERSITY
+    elif any(word in inst_lower for word in ['institute', 'research', 'laboratory', 'lab', 'center']):
+        return InstitutionType.RESEARCH_INSTITUTE
+    elif any(word in inst_lower for word in ['corp', 'inc', 'ltd', 'company', 'technologies']):
+        return InstitutionType.COMPANY
+    elif any(word in inst_lower for word in ['hospital', 'medical', 'health']):
+        return InstitutionType.HOSPITAL
+    elif any(word in inst_lower for word in ['government', 'agency', 'department', 'ministry']):
+        return InstitutionType.GOVERNMENT
+    else:
+        return InstitutionType.UNKNOWN
+
+@lru_cache(maxsize=_NORMALIZATION_CACHE_SIZE)
+def _classify_funding_name(source_text: str) -> FundingSourceType:
+    """Classify funding source type."""
+    source_lower = source_text.lower()
+    
+    if any(word in source_lower for word in ['nsf', 'nih', 'nasa', 'doe', 'darpa', 'government', 'agency']):
+        return FundingSourceType.GOVERNMENT
+    elif any(word in source_lower for word in ['foundation', 'fund']):
+        return FundingSourceType.FOUNDATION
+    elif any(word in source_lower for word in ['corp', 'inc', 'company', 'industries']):
+        return FundingSourceType.INDUSTRY
+    elif any(word in source_lower for word in ['university', 'college', 'school']):
+        return FundingSourceType.UNIVERSITY
+    elif any(word in source_lower for word in ['european', 'international', 'erc', 'horizon']):
+        return FundingSourceType.INTERNATIONAL
+    else:
+        return FundingSourceType.UNKNOWN
+
+_NORMALIZATION_CACHES = (
+    _normalize_institution_name,
+    _normalize_author_name,
+    _normalize_funding_name,
+    _classify_institution_name,
+    _classify_funding_name,
+)
+
 @dataclass
 class AuthorIdentifier:
     """Represents author identifiers from external systems."""
@@ -68,8 +159,7 @@ class AuthorIdentifier:
     def _is_valid_orcid(self, orcid: str) -> bool:
         """Validate ORCID format."""
         # ORCID format: 0000-0000-0000-000X
-        pattern = r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$'
-        return bool(re.match(pattern, orcid))
+        return bool(_ORCID_PATTERN.match(orcid))
 
 @dataclass
 class Institution:
@@ -92,15 +182,7 @@ class Institution:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize institution name for comparison."""
-        # Remove common prefixes/suffixes
-        name = re.sub(r'\b(University of|College of|Institute of|School of)\b', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\b(University|College|Institute|School|Lab|Laboratory)\b', '', name, flags=re.IGNORECASE)
-        
-        # Remove punctuation and normalize spaces
-        name = re.sub(r'[^\w\s]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip().lower()
-        
-        return name
+        return _normalize_institution_name(name)
 
 @dataclass
 class EnhancedAuthor:
@@ -129,13 +211,7 @@ class EnhancedAuthor:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize author name for comparison."""
-        # Remove titles and suffixes
-        name = re.sub(r'\b(Dr|Prof|Professor|PhD|Ph\.D|MD|M\.D)\b\.?', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\b(Jr|Sr|III|IV|V)\b\.?', '', name, flags=re.IGNORECASE)
-        
-        # Normalize spaces and case
-        name = re.sub(r'\s+', ' ', name).strip().lower()
-        return name
+        return _normalize_author_name(name)
     
     def _parse_name(self):
         """Parse author name into components."""
@@ -186,11 +262,7 @@ class FundingSource:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize funding source name."""
-        # Remove common patterns
-        name = re.sub(r'\b(Foundation|Fund|Agency|Council|Institute|Organization)\b', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'[^\w\s]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip().lower()
-        return name
+        return _normalize_funding_name(name)
 
 @dataclass
 class EnhancedMetadata:
@@ -244,16 +316,33 @@ class EnhancedMetadata:
     def _normalize_title(self, title: str) -> str:
         """Normalize title for comparison."""
         # Remove common patterns and normalize
-        title = re.sub(r'[^\w\s]', ' ', title)
-        title = re.sub(r'\s+', ' ', title).strip().lower()
+        title = _PUNCTUATION_PATTERN.sub(' ', title)
+        title = _WHITESPACE_PATTERN.sub(' ', title).strip().lower()
         return title
 
+def _jaccard_match(words1: Set[str], words2: Set[str], threshold: float = 0.8) -> bool:
+    """Jaccard similarity test between two word sets."""
+    if not words1 or not words2:
+        return False
+    return len(words1 & words2) / len(words1 | words2) >= threshold
+
+def _funding_names_match(text_lower: str, text_words: Set[str], known_lower: str, known_words: Set[str]) -> bool:
+    """Substring or two-word-overlap test between lowercased funding names."""
+    # Check for substring matches
+    if known_lower in text_lower or text_lower in known_lower:
+        return True
+    
+    # Check for word overlap
+    return len(text_words & known_words) >= 2
+
 class InstitutionDatabase:
     """Database of known institutions for normalization."""
     
     def __init__(self):
         self.institutions: Dict[str, Institution] = {}
         self.aliases: Dict[str, str] = {}
+        # Word sets of known names, built once for fuzzy matching
+        self._word_sets: Dict[str, Set[str]] = {}
         self._load_common_institutions()
     
     def _load_common_institutions(self):
@@ -284,6 +373,7 @@ class InstitutionDatabase:
             )
             self.institutions[full_name.lower()] = inst
             self.aliases[alias.lower()] = full_name.lower()
+            self._word_sets[full_name.lower()] = set(full_name.lower().split())
     
     def normalize_institution(self, name: str) -> Optional[Institution]:
         """Normalize institution name using database."""
@@ -297,9 +387,13 @@ class InstitutionDatabase:
         if name_lower in self.aliases:
             return self.institutions[self.aliases[name_lower]]
         
-        # Fuzzy matching
+        # Fuzzy matching, splitting the query once and reusing known word sets
+        words = set(name_lower.split())
         for known_name, institution in self.institutions.items():
-            if self._fuzzy_match(name_lower, known_name):
+            known_words = self._word_sets.get(known_name)
+            if known_words is None:
+                known_words = self._word_sets[known_name] = set(known_name.split())
+            if _jaccard_match(words, known_words):
                 return institution
         
         return None
@@ -307,23 +401,15 @@ class InstitutionDatabase:
     def _fuzzy_match(self, name1: str, name2: str, threshold: float = 0.8) -> bool:
         """Simple fuzzy matching for institution names."""
         # Simple Jaccard similarity
-        words1 = set(name1.split())
-        words2 = set(name2.split())
-        
-        if not words1 or not words2:
-            return False
-        
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        similarity = len(intersection) / len(union)
-        return similarity >= threshold
+        return _jaccard_match(set(name1.split()), set(name2.split()), threshold)
 
 class FundingDatabase:
     """Database of known funding sources."""
     
     def __init__(self):
         self.funding_sources: Dict[str, FundingSource] = {}
+        # Lowercased names and word sets of known sources, built once
+        self._match_keys: Dict[str, Tuple[str, Set[str]]] = {}
         self._load_common_funding_sources()
     
     def _load_common_funding_sources(self):
@@ -353,6 +439,94 @@ class FundingDatabase:
                 confidence=0.9
             )
             self.funding_sources[full_name.lower()] = source
+    
+    def match(self, source_text: str) -> Optional[FundingSource]:
+        """Return the first known funding source matching the given text."""
+        text_lower = source_text.lower()
+        text_words = set(text_lower.split())
+        
+        for key, known_source in self.funding_sources.items():
+            match_key = self._match_keys.get(key)
+            if match_key is None:
+                known_lower = known_source.name.lower()
+                match_key = self._match_keys[key] = (known_lower, set(known_lower.split()))
+            if _funding_names_match(text_lower, text_words, *match_key):
+                return known_source
+        
+        return None
+
+# Extraction patterns, compiled once at import with the flags each call site
+# uses, so extract_metadata only runs searches
+_AUTHOR_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?:Authors?|By):\s*(.+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
+    r'(?:^|\n)([A-Z][a-z]+ [A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+ [A-Z][a-z]+)*)\s*(?:\n|$)',
+    r'(?:^|\n)([A-Z]\.\s*[A-Z][a-z]+(?:\s*,\s*[A-Z]\.\s*[A-Z][a-z]+)*)\s*(?:\n|$)',
+))
+
+_INSTITUTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b((?:University of|College of|Institute of|School of)\s+[A-Z][a-zA-Z\s]{3,30})\b',
+    r'\b([A-Z][a-zA-Z\s]{3,30})\s+(?:University|College|Institute|School)\b',
+    r'\b(?:Department of|Dept\.?\s+of)\s+([A-Z][a-zA-Z\s]{3,30})\b',
+    r'\b([A-Z][a-zA-Z\s]{3,30})\s+(?:Research|Laboratory|Lab|Center)\b',
+))
+
+_FUNDING_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:funded|supported|grant|award)\s+(?:by|from|under)\s+([A-Z][a-zA-Z\s,]+?)(?:\s+grant|\s+award|\s+contract|\.|$)',
+    r'(?:Grant|Award|Contract)\s+(?:Number|No\.?|#)\s*([A-Z0-9-]+)',
+    r'(?:NSF|NIH|NASA|DOE|DARPA|ONR|AFOSR)\s+(?:Grant|Award|Contract)?\s*(?:Number|No\.?|#)?\s*([A-Z0-9-]+)',
+))
+
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+_AUTHOR_SECTION_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)authors?\s*:\s*([^\n]+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
+    r'(?i)by\s+([^\n]+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
+))
+
+_AUTHOR_LINE_SKIP_WORDS = ('abstract', 'introduction', 'conclusion', 'keywords', 'email', 'university', 'institute', 'department', 'school', 'college')
+_AUTHOR_LINE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'[A-Z][a-z]+ [A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+ [A-Z][a-z]+)+',  # Multiple "First Last" names
+    r'[A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+,\s*[A-Z][a-z]+)+',  # Multiple "Last, First" names
+    r'[A-Z]\.\s*[A-Z][a-z]+(?:\s*,\s*[A-Z]\.\s*[A-Z][a-z]+)+',  # Multiple "F. Last" names
+))
+
+_AUTHOR_PREFIX_PATTERN = re.compile(r'^(?:by|author|authors):\s*', re.IGNORECASE)
+_TRAILING_AFFILIATION_PATTERN = re.compile(r'\s*\([^)]+\)\s*$')
+_AUTHOR_SEPARATOR_PATTERN = re.compile(r',\s*(?=and\s+|[A-Z])|,\s*and\s+|\s+and\s+')
+
+_NAME_CHARACTERS_PATTERN = re.compile(r'^[A-Za-z\s\.\-\']+$')
+_SINGLE_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
+    r'^[A-Z][a-z]+,\s*[A-Z][a-z]+$',  # Last, First
+    r'^[A-Z]\.\s*[A-Z][a-z]+$',  # F. Last
+    r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
+))
+
+_FUNDING_SECTION_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)acknowledgments?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)funding(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)grants?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)support(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+))
+# Every funding section pattern needs one of these words; a single search for
+# them lets papers without any skip the section scan
+_FUNDING_KEYWORD_PATTERN = re.compile(r'acknowledgment|funding|grant|support', re.IGNORECASE)
+_GRANT_NUMBER_PATTERN = re.compile(r'^[A-Z0-9-]+$')
+
+_ABSTRACT_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)abstract(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)summary(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+))
+_KEYWORD_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)keywords?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)index\s+terms?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+))
+_SUBJECT_PATTERNS = tuple(re.compile(pattern, re.MULTILINE | re.DOTALL) for pattern in (
+    r'(?i)subject\s+classification(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)categories?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+    r'(?i)MSC\s+(?:2020|2010)?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
+))
+_LIST_SEPARATOR_PATTERN = re.compile(r'[,;]')
 
 class EnhancedMetadataExtractor:
     """Main class for enhanced metadata extraction."""
@@ -362,47 +536,41 @@ class EnhancedMetadataExtractor:
         self.institution_db = InstitutionDatabase()
         self.funding_db = FundingDatabase()
         
-        # Improved extraction patterns
-        self.author_patterns = [
-            r'(?:Authors?|By):\s*(.+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
-            r'(?:^|\n)([A-Z][a-z]+ [A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+ [A-Z][a-z]+)*)\s*(?:\n|$)',
-            r'(?:^|\n)([A-Z]\.\s*[A-Z][a-z]+(?:\s*,\s*[A-Z]\.\s*[A-Z][a-z]+)*)\s*(?:\n|$)',
-        ]
-        
-        self.institution_patterns = [
-            r'\b((?:University of|College of|Institute of|School of)\s+[A-Z][a-zA-Z\s]{3,30})\b',
-            r'\b([A-Z][a-zA-Z\s]{3,30})\s+(?:University|College|Institute|School)\b',
-            r'\b(?:Department of|Dept\.?\s+of)\s+([A-Z][a-zA-Z\s]{3,30})\b',
-            r'\b([A-Z][a-zA-Z\s]{3,30})\s+(?:Research|Laboratory|Lab|Center)\b',
-        ]
-        
-        self.funding_patterns = [
-            r'(?:funded|supported|grant|award)\s+(?:by|from|under)\s+([A-Z][a-zA-Z\s,]+?)(?:\s+grant|\s+award|\s+contract|\.|$)',
-            r'(?:Grant|Award|Contract)\s+(?:Number|No\.?|#)\s*([A-Z0-9-]+)',
-            r'(?:NSF|NIH|NASA|DOE|DARPA|ONR|AFOSR)\s+(?:Grant|Award|Contract)?\s*(?:Number|No\.?|#)?\s*([A-Z0-9-]+)',
-        ]
+        # Extraction patterns (precompiled at module level)
+        self.author_patterns = _AUTHOR_PATTERNS
+        self.institution_patterns = _INSTITUTION_PATTERNS
+        self.funding_patterns = _FUNDING_PATTERNS
+        self.email_pattern = _EMAIL_PATTERN
         
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    def extract_metadata(self, text: Union[str, bytes], existing_metadata: Optional[Dict[str, Any]] = None) -> EnhancedMetadata:
+        """Extract enhanced metadata from paper text.
         
-    def extract_metadata(self, text: str, existing_metadata: Optional[Dict[str, Any]] = None) -> EnhancedMetadata:
-        """Extract enhanced metadata from paper text."""
+        Raw UTF-8 bytes are accepted and decoded once up front, so every
+        pattern below scans the same str.
+        """
         logger.info("Starting enhanced metadata extraction")
         
+        if isinstance(text, (bytes, bytearray, memoryview)):
+            text = bytes(text).decode("utf-8", "replace")
+        
         # Initialize with existing metadata if available
         metadata = self._initialize_metadata(existing_metadata)
         
-        # Extract authors with enhanced processing
-        authors = self._extract_authors(text)
-        metadata.authors = authors
-        
-        # Extract funding information
-        funding_sources = self._extract_funding_sources(text)
-        metadata.funding_sources = funding_sources
-        
-        # Extract additional metadata
-        metadata.abstract = self._extract_abstract(text)
-        metadata.keywords = self._extract_keywords(text)
-        metadata.subjects = self._extract_subjects(text)
+        if not text.strip():
+            # Blank input: no pattern can match, so skip every text pass; the
+            # text-derived author list replaces any existing one as usual
+            metadata.authors = []
+        else:
+            # Extract authors with enhanced processing
+            metadata.authors = self._extract_authors(text)
+            
+            # Extract funding information
+            metadata.funding_sources = self._extract_funding_sources(text)
+            
+            # Extract additional metadata
+            metadata.abstract = self._extract_abstract(text)
+            metadata.keywords = self._extract_keywords(text)
+            metadata.subjects = self._extract_subjects(text)
         
         # Calculate quality metrics
         metadata.extraction_confidence = self._calculate_confidence(metadata)
@@ -411,9 +579,30 @@ class EnhancedMetadataExtractor:
         # Word count
         metadata.word_count = len(text.split())
         
-        logger.info(f"Enhanced metadata extraction completed: {len(authors)} authors, {len(funding_sources)} funding sources")
+        logger.info(f"Enhanced metadata extraction completed: {len(metadata.authors)} authors, {len(metadata.funding_sources)} funding sources")
         return metadata
     
+    def extract_metadata_batch(self, texts: List[Union[str, bytes]],
+                               existing_metadata: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[EnhancedMetadata]:
+        """Extract enhanced metadata from several papers with one extractor.
+        
+        The compiled patterns and known-name tables are shared across the
+        whole batch; results are returned in input order.
+        """
+        if existing_metadata is None:
+            existing_metadata = [None] * len(texts)
+        elif len(existing_metadata) != len(texts):
+            raise ValueError("existing_metadata must match texts in length")
+        
+        extract_metadata = self.extract_metadata
+        return [extract_metadata(text, existing) for text, existing in zip(texts, existing_metadata)]
+    
+    @staticmethod
+    def clear_caches() -> None:
+        """Drop memoized name normalizations, e.g. in long-running services."""
+        for cached in _NORMALIZATION_CACHES:
+            cached.cache_clear()
+    
     def _initialize_metadata(self, existing_metadata: Optional[Dict[str, Any]]) -> EnhancedMetadata:
         """Initialize metadata structure with existing data."""
         if not existing_metadata:
@@ -464,10 +653,15 @@ class EnhancedMetadataExtractor:
             parsed_authors = self._process_author_string(author_str, i)
             authors.extend(parsed_authors)
         
-        # Enhance with institutions and additional information
+        # Enhance with institutions and additional information; both steps
+        # read the same window around the name, so locate it once per name
+        contexts: Dict[str, str] = {}
         for author in authors:
-            self._enhance_author_with_institutions(author, text)
-            self._enhance_author_with_contact_info(author, text)
+            author_context = contexts.get(author.name)
+            if author_context is None:
+                author_context = contexts[author.name] = self._find_author_context(author.name, text)
+            self._enhance_author_with_institutions(author, author_context)
+            self._enhance_author_with_contact_info(author, author_context)
         
         return authors
     
@@ -476,13 +670,8 @@ class EnhancedMetadataExtractor:
         author_strings = set()
         
         # Look for explicit author sections first
-        author_sections = [
-            r'(?i)authors?\s*:\s*([^\n]+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
-            r'(?i)by\s+([^\n]+?)(?:\n\s*\n|\nabstract|\nABSTRACT|$)',
-        ]
-        
-        for pattern in author_sections:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _AUTHOR_SECTION_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 author_text = match.group(1).strip()
                 if author_text and 10 <= len(author_text) <= 200:  # Reasonable author section length
@@ -505,19 +694,13 @@ class EnhancedMetadataExtractor:
             return False
         
         # Skip lines that are clearly not authors
-        skip_words = ['abstract', 'introduction', 'conclusion', 'keywords', 'email', 'university', 'institute', 'department', 'school', 'college']
-        if any(word in line.lower() for word in skip_words):
+        line_lower = line.lower()
+        if any(word in line_lower for word in _AUTHOR_LINE_SKIP_WORDS):
             return False
         
         # Look for author name patterns
-        author_patterns = [
-            r'[A-Z][a-z]+ [A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+ [A-Z][a-z]+)+',  # Multiple "First Last" names
-            r'[A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+,\s*[A-Z][a-z]+)+',  # Multiple "Last, First" names
-            r'[A-Z]\.\s*[A-Z][a-z]+(?:\s*,\s*[A-Z]\.\s*[A-Z][a-z]+)+',  # Multiple "F. Last" names
-        ]
-        
-        for pattern in author_patterns:
-            if re.search(pattern, line):
+        for pattern in _AUTHOR_LINE_PATTERNS:
+            if pattern.search(line):
                 return True
         
         return False
@@ -529,11 +712,11 @@ class EnhancedMetadataExtractor:
             return []
         
         # Remove common prefixes/suffixes
-        author_str = re.sub(r'^(?:by|author|authors):\s*', '', author_str, flags=re.IGNORECASE)
-        author_str = re.sub(r'\s*\([^)]+\)\s*$', '', author_str)  # Remove trailing affiliations
+        author_str = _AUTHOR_PREFIX_PATTERN.sub('', author_str)
+        author_str = _TRAILING_AFFILIATION_PATTERN.sub('', author_str)  # Remove trailing affiliations
         
         # Split authors by commas or 'and'
-        author_parts = re.split(r',\s*(?=and\s+|[A-Z])|,\s*and\s+|\s+and\s+', author_str)
+        author_parts = _AUTHOR_SEPARATOR_PATTERN.split(author_str)
         
         authors = []
         for i, part in enumerate(author_parts):
@@ -558,7 +741,7 @@ class EnhancedMetadataExtractor:
             return False
         
         # Should contain letters and limited punctuation
-        if not re.match(r'^[A-Za-z\s\.\-\']+$', name):
+        if not _NAME_CHARACTERS_PATTERN.match(name):
             return False
         
         # Should have at least one space (first and last name)
@@ -566,27 +749,17 @@ class EnhancedMetadataExtractor:
             return False
         
         # Check for common name patterns
-        name_patterns = [
-            r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-            r'^[A-Z][a-z]+,\s*[A-Z][a-z]+$',  # Last, First
-            r'^[A-Z]\.\s*[A-Z][a-z]+$',  # F. Last
-            r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+$',  # First M. Last
-        ]
-        
-        for pattern in name_patterns:
-            if re.match(pattern, name):
+        for pattern in _SINGLE_NAME_PATTERNS:
+            if pattern.match(name):
                 return True
         
         return False
     
-    def _enhance_author_with_institutions(self, author: EnhancedAuthor, text: str):
-        """Enhance author with institutional affiliations."""
-        # Look for institutions near the author's name
-        author_context = self._find_author_context(author.name, text)
-        
+    def _enhance_author_with_institutions(self, author: EnhancedAuthor, author_context: str):
+        """Enhance author with institutional affiliations found near their name."""
         institution_matches = []
         for pattern in self.institution_patterns:
-            matches = re.finditer(pattern, author_context, re.IGNORECASE)
+            matches = pattern.finditer(author_context)
             for match in matches:
                 inst_name = match.group(1).strip()
                 if inst_name and 3 <= len(inst_name) <= 50:
@@ -636,27 +809,11 @@ class EnhancedMetadataExtractor:
     
     def _classify_institution(self, inst_name: str) -> InstitutionType:
         """Classify institution type based on name."""
-        inst_lower = inst_name.lower()
-        
-        if any(word in inst_lower for word in ['university', 'college', 'school']):
-            return InstitutionType.UNIVERSITY
-        elif any(word in inst_lower for word in ['institute', 'research', 'laboratory', 'lab', 'center']):
-            return InstitutionType.RESEARCH_INSTITUTE
-        elif any(word in inst_lower for word in ['corp', 'inc', 'ltd', 'company', 'technologies']):
-            return InstitutionType.COMPANY
-        elif any(word in inst_lower for word in ['hospital', 'medical', 'health']):
-            return InstitutionType.HOSPITAL
-        elif any(word in inst_lower for word in ['government', 'agency', 'department', 'ministry']):
-            return InstitutionType.GOVERNMENT
-        else:
-            return InstitutionType.UNKNOWN
+        return _classify_institution_name(inst_name)
     
-    def _enhance_author_with_contact_info(self, author: EnhancedAuthor, text: str):
-        """Enhance author with contact information."""
-        # Look for email addresses near author name
-        author_context = self._find_author_context(author.name, text)
-        
-        email_matches = re.finditer(self.email_pattern, author_context)
+    def _enhance_author_with_contact_info(self, author: EnhancedAuthor, author_context: str):
+        """Enhance author with contact information found near their name."""
+        email_matches = self.email_pattern.finditer(author_context)
         for match in email_matches:
             email = match.group(0)
             if self._is_likely_author_email(email, author.name):
@@ -681,6 +838,8 @@ class EnhancedMetadataExtractor:
     def _extract_funding_sources(self, text: str) -> List[FundingSource]:
         """Extract funding information from text."""
         funding_sources = []
+        if not _FUNDING_KEYWORD_PATTERN.search(text):
+            return funding_sources
         
         # Look for acknowledgments or funding sections
         funding_sections = self._find_funding_sections(text)
@@ -696,15 +855,8 @@ class EnhancedMetadataExtractor:
         funding_sections = []
         
         # Look for acknowledgments sections
-        ack_patterns = [
-            r'(?i)acknowledgments?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)funding(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)grants?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)support(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-        ]
-        
-        for pattern in ack_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _FUNDING_SECTION_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 section_text = match.group(1).strip()
                 if section_text and len(section_text) < 1000:  # Reasonable section length
@@ -717,7 +869,7 @@ class EnhancedMetadataExtractor:
         sources = []
         
         for pattern in self.funding_patterns:
-            matches = re.finditer(pattern, section, re.IGNORECASE)
+            matches = pattern.finditer(section)
             for match in matches:
                 source_text = match.group(1).strip()
                 if source_text:
@@ -734,7 +886,7 @@ class EnhancedMetadataExtractor:
             return None
         
         # Check if it's a grant number
-        if re.match(r'^[A-Z0-9-]+$', source_text):
+        if _GRANT_NUMBER_PATTERN.match(source_text):
             return FundingSource(
                 name=source_text,
                 normalized_name=source_text.lower(),
@@ -744,15 +896,15 @@ class EnhancedMetadataExtractor:
             )
         
         # Try to match against known funding sources
-        for known_source in self.funding_db.funding_sources.values():
-            if self._fuzzy_match_funding(source_text, known_source.name):
-                return FundingSource(
-                    name=known_source.name,
-                    normalized_name=known_source.normalized_name,
-                    type=known_source.type,
-                    country=known_source.country,
-                    confidence=0.8
-                )
+        known_source = self.funding_db.match(source_text)
+        if known_source:
+            return FundingSource(
+                name=known_source.name,
+                normalized_name=known_source.normalized_name,
+                type=known_source.type,
+                country=known_source.country,
+                confidence=0.8
+            )
         
         # Create new funding source
         source_type = self._classify_funding_source(source_text)
@@ -767,46 +919,17 @@ class EnhancedMetadataExtractor:
         """Fuzzy match funding source names."""
         text_lower = text.lower()
         known_lower = known_name.lower()
-        
-        # Check for substring matches
-        if known_lower in text_lower or text_lower in known_lower:
-            return True
-        
-        # Check for word overlap
-        text_words = set(text_lower.split())
-        known_words = set(known_lower.split())
-        
-        if len(text_words & known_words) >= 2:
-            return True
-        
-        return False
+        return _funding_names_match(text_lower, set(text_lower.split()),
+                                    known_lower, set(known_lower.split()))
     
     def _classify_funding_source(self, source_text: str) -> FundingSourceType:
         """Classify funding source type."""
-        source_lower = source_text.lower()
-        
-        if any(word in source_lower for word in ['nsf', 'nih', 'nasa', 'doe', 'darpa', 'government', 'agency']):
-            return FundingSourceType.GOVERNMENT
-        elif any(word in source_lower for word in ['foundation', 'fund']):
-            return FundingSourceType.FOUNDATION
-        elif any(word in source_lower for word in ['corp', 'inc', 'company', 'industries']):
-            return FundingSourceType.INDUSTRY
-        elif any(word in source_lower for word in ['university', 'college', 'school']):
-            return FundingSourceType.UNIVERSITY
-        elif any(word in source_lower for word in ['european', 'international', 'erc', 'horizon']):
-            return FundingSourceType.INTERNATIONAL
-        else:
-            return FundingSourceType.UNKNOWN
+        return _classify_funding_name(source_text)
     
     def _extract_abstract(self, text: str) -> Optional[str]:
         """Extract abstract from text."""
-        abstract_patterns = [
-            r'(?i)abstract(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)summary(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-        ]
-        
-        for pattern in abstract_patterns:
-            match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _ABSTRACT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 abstract_text = match.group(1).strip()
                 if abstract_text and len(abstract_text) > 50:  # Reasonable abstract length
@@ -818,17 +941,12 @@ class EnhancedMetadataExtractor:
         """Extract keywords from text."""
         keywords = []
         
-        keyword_patterns = [
-            r'(?i)keywords?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)index\s+terms?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-        ]
-        
-        for pattern in keyword_patterns:
-            match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _KEYWORD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 keyword_text = match.group(1).strip()
                 # Split by common separators
-                keyword_list = re.split(r'[,;]', keyword_text)
+                keyword_list = _LIST_SEPARATOR_PATTERN.split(keyword_text)
                 for keyword in keyword_list:
                     keyword = keyword.strip()
                     if keyword and len(keyword) > 2:
@@ -840,18 +958,12 @@ class EnhancedMetadataExtractor:
         """Extract subject classifications from text."""
         subjects = []
         
-        subject_patterns = [
-            r'(?i)subject\s+classification(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)categories?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-            r'(?i)MSC\s+(?:2020|2010)?(?:\s*:|\s*\n)([^.]+?)(?:\n\n|\n[A-Z]|$)',
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        for pattern in _SUBJECT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 subject_text = match.group(1).strip()
                 # Split by common separators
-                subject_list = re.split(r'[,;]', subject_text)
+                subject_list = _LIST_SEPARATOR_PATTERN.split(subject_text)
                 for subject in subject_list:
                     subject = subject.strip()
                     if subject and len(subject) > 2:
@@ -920,7 +1032,8 @@ class EnhancedMetadataExtractor:
             # Convert metadata to dict and handle enum serialization
             metadata_dict = asdict(metadata)
             metadata_dict = self._convert_enums_to_strings(metadata_dict)
-            return json.dumps(metadata_dict, indent=2, ensure_ascii=False)
+            # orjson-backed when available; same indented layout as json.dumps
+            return dumps_json(metadata_dict).decode('utf-8')
         elif format.lower() == "yaml":
             try:
                 import yaml
@@ -965,6 +1078,15 @@ def create_enhanced_metadata_extractor(config: Optional[Dict[str, Any]] = None)
     """Create an enhanced metadata extractor with optional configuration."""
     return EnhancedMetadataExtractor(config)
 
+@lru_cache(maxsize=1)
+def _get_default_extractor() -> EnhancedMetadataExtractor:
+    """Shared unconfigured extractor, built once per process.
+    
+    Extraction never mutates the extractor, so pipeline calls without a
+    config reuse one instance along with its warmed name-matching tables.
+    """
+    return EnhancedMetadataExtractor()
+
 # Integration function for existing pipeline
 def integrate_with_content_extractor(content_extractor_result: Dict[str, Any], 
                                    config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -972,8 +1094,8 @@ def integrate_with_content_extractor(content_extractor_result: Dict[str, Any],
     logger.info("Integrating enhanced metadata extraction with content extractor")
     
     try:
-        # Create extractor
-        extractor = create_enhanced_metadata_extractor(config)
+        # Reuse the shared extractor unless a custom config is requested
+        extractor = create_enhanced_metadata_extractor(config) if config else _get_default_extractor()
         
         # Get text content
         full_text = content_extractor_result.get("full_text", "")
@@ -6,12 +6,14 @@ This module provides comprehensive mathematical equation detection,
 LaTeX conversion, and MathML generation capabilities for academic papers.
 """
 
+import io
 import re
 import logging
 import json
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
+from collections import Counter
 import base64
 
 try:
@@ -38,7 +40,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EquationRegion:
     """Represents a detected mathematical equation region."""
     equation_id: str
@@ -55,9 +57,24 @@ class EquationRegion:
     def __post_init__(self):
         if self.symbols is None:
             self.symbols = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary without a deep copy."""
+        return {
+            "equation_id": self.equation_id,
+            "page_number": self.page_number,
+            "bbox": list(self.bbox),
+            "text_content": self.text_content,
+            "confidence": self.confidence,
+            "equation_type": self.equation_type,
+            "latex_code": self.latex_code,
+            "mathml_code": self.mathml_code,
+            "symbols": list(self.symbols),
+            "complexity_score": self.complexity_score
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class EquationExtractionResult:
     """Complete equation extraction results for a document."""
     total_equations: int
@@ -69,65 +86,90 @@ class EquationExtractionResult:
     processing_time: float
     latex_symbols_used: List[str]
     mathml_available: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary without a deep copy."""
+        return {
+            "total_equations": self.total_equations,
+            "inline_equations": self.inline_equations,
+            "display_equations": self.display_equations,
+            "numbered_equations": self.numbered_equations,
+            "equations": [eq.to_dict() for eq in self.equations],
+            "average_confidence": self.average_confidence,
+            "processing_time": self.processing_time,
+            "latex_symbols_used": list(self.latex_symbols_used),
+            "mathml_available": self.mathml_available
+        }
+
+
+_INLINE_PATTERNS = (
+    r'\$[^$]+\$',  # Single dollar signs
+    r'\\begin\{math\}.*?\\end\{math\}',  # Math environment
+    r'\\(.*?\\)',  # Parentheses delimiters
+    r'[a-zA-Z]_\{[^}]+\}',  # Subscripts
+    r'[a-zA-Z]\^\{[^}]+\}',  # Superscripts
+    r'\\[a-zA-Z]+\{[^}]*\}',  # LaTeX commands
+    r'[a-zA-Z]+\s*[=≠<>≤≥≈∝∞∫∑∏]\s*[a-zA-Z0-9]+',  # Mathematical relations
+    r'[α-ωΑ-Ω]',  # Greek letters
+    r'[∂∇∆∫∑∏√∞±×÷≤≥≠≈∝∈∉⊂⊃∪∩∧∨¬∀∃]',  # Mathematical symbols
+)
+
+_DISPLAY_PATTERNS = (
+    r'\$\$.*?\$\$',  # Double dollar signs
+    r'\\begin\{equation\}.*?\\end\{equation\}',  # Equation environment
+    r'\\begin\{align\}.*?\\end\{align\}',  # Align environment
+    r'\\begin\{eqnarray\}.*?\\end\{eqnarray\}',  # Eqnarray environment
+    r'\\begin\{displaymath\}.*?\\end\{displaymath\}',  # Display math
+    r'\\begin\{gather\}.*?\\end\{gather\}',  # Gather environment
+    r'\\begin\{multline\}.*?\\end\{multline\}',  # Multline environment
+)
+
+# Numbered environments share one alternation so the text is scanned once
+_NUMBERED_PATTERNS = (
+    r'\\begin\{(equation|align|eqnarray)\}.*?\\end\{\1\}',
+    r'\([0-9]+(?:\.[0-9]+)?\)\s*$',  # Equation numbers, e.g. (3) or (2.1)
+)
+
+_LATEX_SYMBOLS = (
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta',
+    'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi',
+    'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega',
+    'Gamma', 'Delta', 'Theta', 'Lambda', 'Xi', 'Pi', 'Sigma', 'Upsilon',
+    'Phi', 'Psi', 'Omega', 'sum', 'prod', 'int', 'oint', 'partial',
+    'nabla', 'infty', 'pm', 'mp', 'times', 'div', 'cdot', 'ast',
+    'star', 'circ', 'bullet', 'cap', 'cup', 'uplus', 'sqcap', 'sqcup',
+    'vee', 'wedge', 'setminus', 'wr', 'diamond', 'bigtriangleup',
+    'bigtriangledown', 'triangleleft', 'triangleright', 'lhd', 'rhd',
+    'unlhd', 'unrhd', 'oplus', 'ominus', 'otimes', 'oslash', 'odot',
+    'bigcirc', 'dagger', 'ddagger', 'amalg', 'leq', 'geq', 'equiv',
+    'models', 'prec', 'succ', 'sim', 'perp', 'preceq', 'succeq',
+    'simeq', 'll', 'gg', 'asymp', 'parallel', 'subset', 'supset',
+    'approx', 'bowtie', 'subseteq', 'supseteq', 'cong', 'neq',
+    'smile', 'sqsubseteq', 'sqsupseteq', 'doteq', 'frown', 'in',
+    'ni', 'propto', 'vdash', 'dashv', 'sqrt', 'frac', 'sum', 'int'
+)
+
+# Patterns are compiled once at import and shared by every detector instance
+_COMPILED_INLINE = tuple(re.compile(pattern, re.DOTALL) for pattern in _INLINE_PATTERNS)
+_COMPILED_DISPLAY = tuple(re.compile(pattern, re.DOTALL) for pattern in _DISPLAY_PATTERNS)
+_COMPILED_NUMBERED = tuple(re.compile(pattern, re.DOTALL) for pattern in _NUMBERED_PATTERNS)
+
+_LATEX_COMMAND_PATTERN = re.compile(r'\\[a-zA-Z]+')
+_OPERATOR_PATTERN = re.compile(r'[=≠<>≤≥≈∝∞∫∑∏±×÷]')
 
 
 class MathematicalPatternDetector:
     """Advanced mathematical pattern detection and classification."""
     
     def __init__(self):
-        self.inline_patterns = [
-            r'\$[^$]+\$',  # Single dollar signs
-            r'\\begin\{math\}.*?\\end\{math\}',  # Math environment
-            r'\\(.*?\\)',  # Parentheses delimiters
-            r'[a-zA-Z]_\{[^}]+\}',  # Subscripts
-            r'[a-zA-Z]\^\{[^}]+\}',  # Superscripts
-            r'\\[a-zA-Z]+\{[^}]*\}',  # LaTeX commands
-            r'[a-zA-Z]+\s*[=≠<>≤≥≈∝∞∫∑∏]\s*[a-zA-Z0-9]+',  # Mathematical relations
-            r'[α-ωΑ-Ω]',  # Greek letters
-            r'[∂∇∆∫∑∏√∞±×÷≤≥≠≈∝∈∉⊂⊃∪∩∧∨¬∀∃]',  # Mathematical symbols
-        ]
-        
-        self.display_patterns = [
-            r'\$\$.*?\$\$',  # Double dollar signs
-            r'\\begin\{equation\}.*?\\end\{equation\}',  # Equation environment
-            r'\\begin\{align\}.*?\\end\{align\}',  # Align environment
-            r'\\begin\{eqnarray\}.*?\\end\{eqnarray\}',  # Eqnarray environment
-            r'\\begin\{displaymath\}.*?\\end\{displaymath\}',  # Display math
-            r'\\begin\{gather\}.*?\\end\{gather\}',  # Gather environment
-            r'\\begin\{multline\}.*?\\end\{multline\}',  # Multline environment
-        ]
-        
-        self.numbered_patterns = [
-            r'\\begin\{equation\}.*?\\end\{equation\}',
-            r'\\begin\{align\}.*?\\end\{align\}',
-            r'\\begin\{eqnarray\}.*?\\end\{eqnarray\}',
-            r'\([0-9]+\)\s*$',  # Equation numbers
-            r'\([0-9]+\.[0-9]+\)\s*$',  # Numbered equations
-        ]
-        
-        self.latex_symbols = [
-            'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta',
-            'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi',
-            'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega',
-            'Gamma', 'Delta', 'Theta', 'Lambda', 'Xi', 'Pi', 'Sigma', 'Upsilon',
-            'Phi', 'Psi', 'Omega', 'sum', 'prod', 'int', 'oint', 'partial',
-            'nabla', 'infty', 'pm', 'mp', 'times', 'div', 'cdot', 'ast',
-            'star', 'circ', 'bullet', 'cap', 'cup', 'uplus', 'sqcap', 'sqcup',
-            'vee', 'wedge', 'setminus', 'wr', 'diamond', 'bigtriangleup',
-            'bigtriangledown', 'triangleleft', 'triangleright', 'lhd', 'rhd',
-            'unlhd', 'unrhd', 'oplus', 'ominus', 'otimes', 'oslash', 'odot',
-            'bigcirc', 'dagger', 'ddagger', 'amalg', 'leq', 'geq', 'equiv',
-            'models', 'prec', 'succ', 'sim', 'perp', 'preceq', 'succeq',
-            'simeq', 'll', 'gg', 'asymp', 'parallel', 'subset', 'supset',
-            'approx', 'bowtie', 'subseteq', 'supseteq', 'cong', 'neq',
-            'smile', 'sqsubseteq', 'sqsupseteq', 'doteq', 'frown', 'in',
-            'ni', 'propto', 'vdash', 'dashv', 'sqrt', 'frac', 'sum', 'int'
-        ]
-        
-        # Compile patterns for performance
-        self.compiled_inline = [re.compile(pattern, re.DOTALL) for pattern in self.inline_patterns]
-        self.compiled_display = [re.compile(pattern, re.DOTALL) for pattern in self.display_patterns]
-        self.compiled_numbered = [re.compile(pattern, re.DOTALL) for pattern in self.numbered_patterns]
+        self.inline_patterns = _INLINE_PATTERNS
+        self.display_patterns = _DISPLAY_PATTERNS
+        self.numbered_patterns = _NUMBERED_PATTERNS
+        self.latex_symbols = _LATEX_SYMBOLS
+        
+        self.compiled_inline = _COMPILED_INLINE
+        self.compiled_display = _COMPILED_DISPLAY
+        self.compiled_numbered = _COMPILED_NUMBERED
 
 
 class LaTeXConverter:
@@ -382,30 +424,29 @@ class EquationProcessor:
             
             doc.close()
             
-            # Calculate statistics
-            inline_count = sum(1 for eq in all_equations if eq.equation_type == 'inline')
-            display_count = sum(1 for eq in all_equations if eq.equation_type == 'display')
-            numbered_count = sum(1 for eq in all_equations if eq.equation_type == 'numbered')
-            
-            avg_confidence = sum(eq.confidence for eq in all_equations) / len(all_equations) if all_equations else 0.0
-            
-            # Extract unique LaTeX symbols
-            latex_symbols = set()
+            # Calculate statistics and collect LaTeX symbols in a single pass
+            type_counts = Counter()
+            symbol_counts = Counter()
+            total_confidence = 0.0
             for eq in all_equations:
+                type_counts[eq.equation_type] += 1
+                total_confidence += eq.confidence
                 if eq.symbols:
-                    latex_symbols.update(eq.symbols)
+                    symbol_counts.update(eq.symbols)
+            
+            avg_confidence = total_confidence / len(all_equations) if all_equations else 0.0
             
             processing_time = time.time() - start_time
             
             result = EquationExtractionResult(
                 total_equations=len(all_equations),
-                inline_equations=inline_count,
-                display_equations=display_count,
-                numbered_equations=numbered_count,
+                inline_equations=type_counts['inline'],
+                display_equations=type_counts['display'],
+                numbered_equations=type_counts['numbered'],
                 equations=all_equations,
                 average_confidence=avg_confidence,
                 processing_time=processing_time,
-                latex_symbols_used=list(latex_symbols),
+                latex_symbols_used=[symbol for symbol, _ in symbol_counts.most_common()],
                 mathml_available=self.generate_mathml
             )
             
@@ -428,11 +469,12 @@ class EquationProcessor:
     
     def _process_page(self, page, page_num: int) -> List[EquationRegion]:
         """Process a single page for mathematical equations."""
+        return self._process_page_text(page.get_text(), page_num)
+    
+    def _process_page_text(self, text: str, page_num: int) -> List[EquationRegion]:
+        """Detect and enhance equations in the extracted text of one page."""
         page_equations = []
         
-        # Extract text and analyze for equations
-        text = page.get_text()
-        
         # Detect inline equations
         if self.extract_inline_equations:
             inline_equations = self._detect_inline_equations(text, page_num)
@@ -456,68 +498,40 @@ class EquationProcessor:
     
     def _detect_inline_equations(self, text: str, page_num: int) -> List[EquationRegion]:
         """Detect inline mathematical equations."""
-        equations = []
-        
-        for pattern in self.pattern_detector.compiled_inline:
-            matches = pattern.finditer(text)
-            for match in matches:
-                equation_text = match.group(0)
-                confidence = self._calculate_confidence(equation_text, 'inline')
-                
-                if confidence >= self.min_confidence_threshold:
-                    equation = EquationRegion(
-                        equation_id=f"inline_{page_num}_{len(equations)}",
-                        page_number=page_num,
-                        bbox=(0, 0, 0, 0),  # Would need OCR/layout analysis for precise location
-                        text_content=equation_text,
-                        confidence=confidence,
-                        equation_type='inline'
-                    )
-                    equations.append(equation)
-        
-        return equations
+        return self._detect_equations(text, page_num, self.pattern_detector.compiled_inline, 'inline')
     
     def _detect_display_equations(self, text: str, page_num: int) -> List[EquationRegion]:
         """Detect display mathematical equations."""
-        equations = []
-        
-        for pattern in self.pattern_detector.compiled_display:
-            matches = pattern.finditer(text)
-            for match in matches:
-                equation_text = match.group(0)
-                confidence = self._calculate_confidence(equation_text, 'display')
-                
-                if confidence >= self.min_confidence_threshold:
-                    equation = EquationRegion(
-                        equation_id=f"display_{page_num}_{len(equations)}",
-                        page_number=page_num,
-                        bbox=(0, 0, 0, 0),
-                        text_content=equation_text,
-                        confidence=confidence,
-                        equation_type='display'
-                    )
-                    equations.append(equation)
-        
-        return equations
+        return self._detect_equations(text, page_num, self.pattern_detector.compiled_display, 'display')
     
     def _detect_numbered_equations(self, text: str, page_num: int) -> List[EquationRegion]:
         """Detect numbered mathematical equations."""
+        return self._detect_equations(text, page_num, self.pattern_detector.compiled_numbered, 'numbered')
+    
+    def _detect_equations(self, text: str, page_num: int, patterns: Tuple[re.Pattern, ...],
+                          equation_type: str) -> List[EquationRegion]:
+        """Scan the whole page text with each pattern and keep confident matches."""
         equations = []
+        # Short matches such as Greek letters repeat many times per page, so
+        # score each distinct match text only once
+        confidence_cache: Dict[str, float] = {}
         
-        for pattern in self.pattern_detector.compiled_numbered:
-            matches = pattern.finditer(text)
-            for match in matches:
+        for pattern in patterns:
+            for match in pattern.finditer(text):
                 equation_text = match.group(0)
-                confidence = self._calculate_confidence(equation_text, 'numbered')
+                confidence = confidence_cache.get(equation_text)
+                if confidence is None:
+                    confidence = self._calculate_confidence(equation_text, equation_type)
+                    confidence_cache[equation_text] = confidence
                 
                 if confidence >= self.min_confidence_threshold:
                     equation = EquationRegion(
-                        equation_id=f"numbered_{page_num}_{len(equations)}",
+                        equation_id=f"{equation_type}_{page_num}_{len(equations)}",
                         page_number=page_num,
-                        bbox=(0, 0, 0, 0),
+                        bbox=(0, 0, 0, 0),  # Would need OCR/layout analysis for precise location
                         text_content=equation_text,
                         confidence=confidence,
-                        equation_type='numbered'
+                        equation_type=equation_type
                     )
                     equations.append(equation)
         
@@ -536,16 +550,17 @@ class EquationProcessor:
         confidence += type_confidence.get(equation_type, 0.5)
         
         # Bonus for mathematical symbols
+        lowered = text.lower()
         math_symbols = sum(1 for symbol in self.pattern_detector.latex_symbols 
-                          if symbol in text.lower())
+                          if symbol in lowered)
         confidence += min(math_symbols * 0.1, 0.3)
         
         # Bonus for LaTeX commands
-        latex_commands = len(re.findall(r'\\[a-zA-Z]+', text))
+        latex_commands = len(_LATEX_COMMAND_PATTERN.findall(text))
         confidence += min(latex_commands * 0.05, 0.2)
         
         # Bonus for mathematical operators
-        operators = len(re.findall(r'[=≠<>≤≥≈∝∞∫∑∏±×÷]', text))
+        operators = len(_OPERATOR_PATTERN.findall(text))
         confidence += min(operators * 0.1, 0.2)
         
         return min(confidence, 1.0)
@@ -585,9 +600,10 @@ class EquationProcessor:
     def _extract_symbols(self, text: str) -> List[str]:
         """Extract mathematical symbols from equation text."""
         symbols = set()
+        lowered = text.lower()
         
         for symbol in self.pattern_detector.latex_symbols:
-            if symbol in text.lower():
+            if symbol in lowered:
                 symbols.add(symbol)
         
         # Add Unicode mathematical symbols
@@ -604,20 +620,21 @@ class EquationProcessor:
         # Base complexity by length
         complexity += len(text) * 0.01
         
+        # Character counts use str.count (a C-level scan) rather than regex
         # Bonus for nested structures
         nested_structures = text.count('{') + text.count('(') + text.count('[')
         complexity += nested_structures * 0.1
         
         # Bonus for integrals, sums, products
-        advanced_operators = len(re.findall(r'[∫∑∏]', text))
+        advanced_operators = text.count('∫') + text.count('∑') + text.count('∏')
         complexity += advanced_operators * 0.3
         
         # Bonus for fractions
-        fractions = len(re.findall(r'\\frac|/', text))
+        fractions = text.count('\\frac') + text.count('/')
         complexity += fractions * 0.2
         
         # Bonus for powers and subscripts
-        powers = len(re.findall(r'[\^_]', text))
+        powers = text.count('^') + text.count('_')
         complexity += powers * 0.1
         
         return min(complexity, 10.0)  # Cap at 10.0
@@ -628,33 +645,37 @@ class EquationProcessor:
         
         if format == 'json':
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(result), f, indent=2, ensure_ascii=False)
+                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
         
         elif format == 'latex':
+            buffer = io.StringIO()
+            buffer.write("% Mathematical Equations Extracted by Paper2Data\n")
+            buffer.write("% Version 1.1 - Advanced Academic Processing\n\n")
+            
+            for equation in result.equations:
+                buffer.write(f"% Equation {equation.equation_id} (Page {equation.page_number})\n"
+                             f"% Type: {equation.equation_type}, Confidence: {equation.confidence:.2f}\n")
+                if equation.latex_code:
+                    buffer.write(f"{equation.latex_code}\n\n")
+                else:
+                    buffer.write(f"% Original text: {equation.text_content}\n\n")
+            
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("% Mathematical Equations Extracted by Paper2Data\n")
-                f.write("% Version 1.1 - Advanced Academic Processing\n\n")
-                
-                for equation in result.equations:
-                    f.write(f"% Equation {equation.equation_id} (Page {equation.page_number})\n")
-                    f.write(f"% Type: {equation.equation_type}, Confidence: {equation.confidence:.2f}\n")
-                    if equation.latex_code:
-                        f.write(f"{equation.latex_code}\n\n")
-                    else:
-                        f.write(f"% Original text: {equation.text_content}\n\n")
+                f.write(buffer.getvalue())
         
         elif format == 'mathml':
+            buffer = io.StringIO()
+            buffer.write('<?xml version="1.0" encoding="UTF-8"?>\n<equations>\n')
+            
+            for equation in result.equations:
+                buffer.write(f'  <equation id="{equation.equation_id}" page="{equation.page_number}" type="{equation.equation_type}">\n')
+                if equation.mathml_code:
+                    buffer.write(f'    {equation.mathml_code}\n')
+                buffer.write('  </equation>\n')
+            
+            buffer.write('</equations>\n')
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write('<equations>\n')
-                
-                for equation in result.equations:
-                    f.write(f'  <equation id="{equation.equation_id}" page="{equation.page_number}" type="{equation.equation_type}">\n')
-                    if equation.mathml_code:
-                        f.write(f'    {equation.mathml_code}\n')
-                    f.write('  </equation>\n')
-                
-                f.write('</equations>\n')
+                f.write(buffer.getvalue())
         
         logger.info(f"Equations exported to {output_path} in {format} format")
 
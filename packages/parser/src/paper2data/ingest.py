@@ -343,6 +343,29 @@ class DOIIngestor(BaseIngestor):
             raise ProcessingError(f"Unexpected error during DOI resolution: {str(e)}")
 
 
+def detect_input_type(source: str) -> str:
+    """Classify an input source as 'doi', 'url', 'arxiv' or 'pdf'.
+    
+    Only cheap prefix and substring checks are used; no I/O is performed.
+    """
+    if source.startswith(('doi:', '10.')) or 'doi.org' in source:
+        return "doi"
+    if source.startswith(('http://', 'https://')):
+        return "url"
+    if source.startswith('arxiv:'):
+        return "arxiv"
+    return "pdf"
+
+
+# Ingestor class for each detected input type
+_INGESTOR_DISPATCH = {
+    "doi": DOIIngestor,
+    "url": URLIngestor,
+    "arxiv": URLIngestor,
+    "pdf": PDFIngestor,
+}
+
+
 def create_ingestor(input_source: str) -> BaseIngestor:
     """Factory function to create appropriate ingestor based on input type.
     
@@ -359,27 +382,12 @@ def create_ingestor(input_source: str) -> BaseIngestor:
     
     # Clean input
     source = input_source.strip()
+    input_type = detect_input_type(source)
+    logger.debug(f"Detected {input_type} input")
     
-    # Check for DOI
-    if (source.startswith('doi:') or 
-        source.startswith('10.') or 
-        'dx.doi.org' in source or
-        'doi.org' in source):
-        logger.debug("Detected DOI input")
-        return DOIIngestor(source)
-    
-    # Check for URL
-    if source.startswith(('http://', 'https://')):
-        logger.debug("Detected URL input")
-        return URLIngestor(source)
-    
-    # Check for arXiv ID (without full URL)
-    if source.startswith('arxiv:'):
-        arxiv_id = source[6:]
-        url = f"https://arxiv.org/abs/{arxiv_id}"
-        logger.debug(f"Converting arXiv ID to URL: {url}")
-        return URLIngestor(url)
+    if input_type == "arxiv":
+        # Bare arXiv IDs are fetched through their abstract page URL
+        source = f"https://arxiv.org/abs/{source[6:]}"
+        logger.debug(f"Converting arXiv ID to URL: {source}")
     
-    # Default to PDF file
-    logger.debug("Assuming PDF file input")
-    return PDFIngestor(source) 
\ No newline at end of file
+    return _INGESTOR_DISPATCH[input_type](source)
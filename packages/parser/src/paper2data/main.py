@@ -5,248 +5,325 @@ Paper2Data Parser - Command Line Interface
 Main entry point for the Python parser that can be called from the Node.js CLI.
 """
 
+import os
 import sys
 import json
+import time
+import shutil
+import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
+import logging.handlers
 
-from . import (
-    create_ingestor, 
-    extract_all_content,
+from .ingest import create_ingestor
+from .extractor import extract_all_content
+from .utils import (
     setup_logging, 
     get_logger,
     load_config,
     save_json,
     create_output_structure,
     format_output,
+    get_file_hash,
+    get_cache_directory,
     ValidationError,
     ProcessingError,
     ConfigurationError
 )
 from .help_system import help_system
+from . import __version__
 
 
+# Command line arguments as (flags, add_argument keyword arguments)
+_ARGUMENT_SPEC: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = (
+    (("command",), {
+        "choices": ["convert", "validate", "info", "config", "help"],
+        "help": "Command to execute",
+    }),
+    (("input",), {
+        "nargs": "?",
+        "help": "Input source: PDF file path, arXiv URL, or DOI (not required for config/help commands)",
+    }),
+    (("-o", "--output"), {
+        "type": Path,
+        "help": "Output directory (default: ./paper2data_output)",
+    }),
+    (("-f", "--format"), {
+        "type": str,
+        "default": "json",
+        "help": "Comma-separated output formats: json,yaml,markdown,html,latex,word,epub,csv (default: json)",
+    }),
+    (("--config",), {
+        "type": Path,
+        "help": "Configuration file path",
+    }),
+    (("--log-level",), {
+        "choices": ["DEBUG", "INFO", "WARNING", "ERROR"],
+        "default": "INFO",
+        "help": "Logging level (default: INFO)",
+    }),
+    (("--log-file",), {
+        "type": Path,
+        "help": "Log file path",
+    }),
+    (("--no-figures",), {
+        "action": "store_true",
+        "help": "Skip figure extraction",
+    }),
+    (("--no-tables",), {
+        "action": "store_true",
+        "help": "Skip table extraction",
+    }),
+    (("--no-citations",), {
+        "action": "store_true",
+        "help": "Skip citation extraction",
+    }),
+    (("--dry-run",), {
+        "action": "store_true",
+        "help": "Validate input without processing",
+    }),
+    (("--no-cache",), {
+        "action": "store_true",
+        "help": "Always re-run extraction instead of reusing cached results",
+    }),
+    (("--json-output",), {
+        "action": "store_true",
+        "help": "Output results as JSON to stdout (for CLI integration)",
+    }),
+    # Configuration-specific arguments
+    (("--config-action",), {
+        "choices": ["create", "validate", "fix", "status", "help"],
+        "default": "help",
+        "help": "Configuration action to perform (default: help)",
+    }),
+    (("--profile",), {
+        "choices": ["fast", "balanced", "thorough", "research"],
+        "help": "Configuration profile to use",
+    }),
+    (("--interactive",), {
+        "action": "store_true",
+        "help": "Interactive configuration setup",
+    }),
+    # Help-specific arguments
+    (("--help-section",), {
+        "choices": ["overview", "commands", "examples", "configuration", "troubleshooting", "advanced"],
+        "help": "Show specific help section",
+    }),
+    (("--help-command",), {
+        "choices": ["convert", "validate", "info", "config"],
+        "help": "Show detailed help for specific command",
+    }),
+    (("--system-info",), {
+        "action": "store_true",
+        "help": "Show system information",
+    }),
+    (("--contextual-help",), {
+        "action": "store_true",
+        "help": "Show contextual help based on current system state",
+    }),
+    (("--error-help",), {
+        "type": str,
+        "help": "Get help for a specific error message",
+    }),
+    (("--usage-recommendations",), {
+        "action": "store_true",
+        "help": "Get usage recommendations based on system capabilities",
+    }),
+    (("--config-help",), {
+        "action": "store_true",
+        "help": "Show detailed configuration help with current system context",
+    }),
+    (("--performance-help",), {
+        "action": "store_true",
+        "help": "Show performance tuning help based on system capabilities",
+    }),
+    (("--template",), {
+        "type": str,
+        "default": None,
+        "help": "Template theme for export (e.g., academic, modern, minimal, presentation)",
+    }),
+    (("--metadata",), {
+        "type": str,
+        "default": None,
+        "help": "Metadata extraction level: basic, enhanced, full",
+    }),
+    (("--equations",), {
+        "action": "store_true",
+        "help": "Enable mathematical equation processing (default: true)",
+    }),
+    (("--no-equations",), {
+        "action": "store_true",
+        "help": "Disable mathematical equation processing",
+    }),
+    (("--advanced-figures",), {
+        "action": "store_true",
+        "help": "Enable AI-powered figure analysis (default: true)",
+    }),
+    (("--no-advanced-figures",), {
+        "action": "store_true",
+        "help": "Disable AI-powered figure analysis",
+    }),
+    (("--bibliographic",), {
+        "action": "store_true",
+        "help": "Enable bibliographic parsing (default: true)",
+    }),
+    (("--no-bibliographic",), {
+        "action": "store_true",
+        "help": "Disable bibliographic parsing",
+    }),
+    (("--citation-network",), {
+        "action": "store_true",
+        "help": "Enable citation network analysis (default: true)",
+    }),
+    (("--no-citation-network",), {
+        "action": "store_true",
+        "help": "Disable citation network analysis",
+    }),
+    (("--performance",), {
+        "action": "store_true",
+        "help": "Enable performance optimizations (default: true)",
+    }),
+    (("--no-performance",), {
+        "action": "store_true",
+        "help": "Disable performance optimizations",
+    }),
+)
+
+
+@lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
-    """Set up command line argument parser."""
+    """Set up command line argument parser.
+    
+    The parser is built once per process and reused on later calls.
+    Arguments are declared in _ARGUMENT_SPEC.
+    """
     parser = argparse.ArgumentParser(
         description="Paper2Data Parser - Extract content from academic papers",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=help_system.show_section("overview")
     )
     
-    parser.add_argument(
-        "command",
-        choices=["convert", "validate", "info", "config", "help"],
-        help="Command to execute"
-    )
-    
-    parser.add_argument(
-        "input",
-        nargs="?",
-        help="Input source: PDF file path, arXiv URL, or DOI (not required for config/help commands)"
-    )
-    
-    parser.add_argument(
-        "-o", "--output",
-        type=Path,
-        help="Output directory (default: ./paper2data_output)"
-    )
-    
-    parser.add_argument(
-        "-f", "--format",
-        type=str,
-        default="json",
-        help="Comma-separated output formats: json,yaml,markdown,html,latex,word,epub,csv (default: json)"
-    )
-    
-    parser.add_argument(
-        "--config",
-        type=Path,
-        help="Configuration file path"
-    )
-    
-    parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
-        help="Logging level (default: INFO)"
-    )
-    
-    parser.add_argument(
-        "--log-file",
-        type=Path,
-        help="Log file path"
-    )
-    
-    parser.add_argument(
-        "--no-figures",
-        action="store_true",
-        help="Skip figure extraction"
-    )
-    
-    parser.add_argument(
-        "--no-tables",
-        action="store_true", 
-        help="Skip table extraction"
-    )
-    
-    parser.add_argument(
-        "--no-citations",
-        action="store_true",
-        help="Skip citation extraction"
-    )
-    
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Validate input without processing"
-    )
-    
-    parser.add_argument(
-        "--json-output",
-        action="store_true",
-        help="Output results as JSON to stdout (for CLI integration)"
-    )
-    
-    # Configuration-specific arguments
-    parser.add_argument(
-        "--config-action",
-        choices=["create", "validate", "fix", "status", "help"],
-        default="help",
-        help="Configuration action to perform (default: help)"
-    )
-    
-    parser.add_argument(
-        "--profile",
-        choices=["fast", "balanced", "thorough", "research"],
-        help="Configuration profile to use"
-    )
-    
-    parser.add_argument(
-        "--interactive",
-        action="store_true",
-        help="Interactive configuration setup"
-    )
-    
-    # Help-specific arguments
-    parser.add_argument(
-        "--help-section",
-        choices=["overview", "commands", "examples", "configuration", "troubleshooting", "advanced"],
-        help="Show specific help section"
-    )
-    
-    parser.add_argument(
-        "--help-command",
-        choices=["convert", "validate", "info", "config"],
-        help="Show detailed help for specific command"
-    )
-    
-    parser.add_argument(
-        "--system-info",
-        action="store_true",
-        help="Show system information"
-    )
-    
-    parser.add_argument(
-        "--contextual-help",
-        action="store_true",
-        help="Show contextual help based on current system state"
-    )
-    
-    parser.add_argument(
-        "--error-help",
-        type=str,
-        help="Get help for a specific error message"
-    )
-    
-    parser.add_argument(
-        "--usage-recommendations",
-        action="store_true",
-        help="Get usage recommendations based on system capabilities"
-    )
-    
-    parser.add_argument(
-        "--config-help",
-        action="store_true",
-        help="Show detailed configuration help with current system context"
-    )
-    
-    parser.add_argument(
-        "--performance-help",
-        action="store_true",
-        help="Show performance tuning help based on system capabilities"
-    )
-    
-    parser.add_argument(
-        "--template",
-        type=str,
-        default=None,
-        help="Template theme for export (e.g., academic, modern, minimal, presentation)"
-    )
-    parser.add_argument(
-        "--metadata",
-        type=str,
-        default=None,
-        help="Metadata extraction level: basic, enhanced, full"
-    )
-    parser.add_argument(
-        "--equations",
-        action="store_true",
-        help="Enable mathematical equation processing (default: true)"
-    )
-    parser.add_argument(
-        "--no-equations",
-        action="store_true",
-        help="Disable mathematical equation processing"
-    )
-    parser.add_argument(
-        "--advanced-figures",
-        action="store_true",
-        help="Enable AI-powered figure analysis (default: true)"
-    )
-    parser.add_argument(
-        "--no-advanced-figures",
-        action="store_true",
-        help="Disable AI-powered figure analysis"
-    )
-    parser.add_argument(
-        "--bibliographic",
-        action="store_true",
-        help="Enable bibliographic parsing (default: true)"
-    )
-    parser.add_argument(
-        "--no-bibliographic",
-        action="store_true",
-        help="Disable bibliographic parsing"
-    )
-    parser.add_argument(
-        "--citation-network",
-        action="store_true",
-        help="Enable citation network analysis (default: true)"
-    )
-    parser.add_argument(
-        "--no-citation-network",
-        action="store_true",
-        help="Disable citation network analysis"
-    )
-    parser.add_argument(
-        "--performance",
-        action="store_true",
-        help="Enable performance optimizations (default: true)"
-    )
-    parser.add_argument(
-        "--no-performance",
-        action="store_true",
-        help="Disable performance optimizations"
-    )
+    for flags, options in _ARGUMENT_SPEC:
+        parser.add_argument(*flags, **options)
     
     return parser
 
 
-def validate_input_command(input_source: str, args: argparse.Namespace) -> Dict[str, Any]:
-    """Validate input source and return validation results."""
+def _write_output_file(task: Tuple[str, Union[str, bytes]]) -> None:
+    """Write a single (path, data) output task.
+    
+    Text is encoded to UTF-8 in one call and, like binary image data, written
+    through a raw file descriptor, skipping the buffered/text file wrappers.
+    """
+    path, data = task
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than requested, so loop until done
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_output_files(tasks: List[Tuple[str, Union[str, bytes]]], max_workers: int = 8) -> None:
+    """Write independent output files concurrently."""
+    if not tasks:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        list(executor.map(_write_output_file, tasks))
+
+
+# Bounds on the conversion cache: entries unused for longer than the maximum
+# age are dropped, and only the most recently used entries are kept
+_CACHE_MAX_ENTRIES = 32
+_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+def _conversion_cache_key(content_hash: str, args: argparse.Namespace, config: Dict[str, Any]) -> str:
+    """Combine the input hash with the parser version and every option that changes the output tree."""
+    options = json.dumps({
+        "version": __version__,
+        "format": args.format,
+        "no_figures": args.no_figures,
+        "no_tables": args.no_tables,
+        "no_citations": args.no_citations,
+        "processing": config.get("processing", {}),
+    }, sort_keys=True, default=str)
+    return hashlib.blake2b(f"{content_hash}:{options}".encode(), digest_size=16).hexdigest()
+
+
+def _restore_cached_conversion(cache_dir: Path, output_dir: Path, input_source: str) -> Optional[Dict[str, Any]]:
+    """Copy a cached output tree into output_dir and rebuild the command result."""
+    result_file = cache_dir / "result.json"
+    if not result_file.is_file():
+        return None
+    
+    with open(result_file, 'rb') as f:
+        result = json.load(f)
+    
+    cached_root = cache_dir / Path(result["output_directory"]).name
+    if not cached_root.is_dir():
+        return None
+    
+    output_root = Path(output_dir) / cached_root.name
+    shutil.copytree(cached_root, output_root, dirs_exist_ok=True)
+    # Mark the entry as recently used so pruning keeps it
+    os.utime(result_file)
+    
+    result.update({
+        "input_source": input_source,
+        "output_directory": str(output_root),
+        "exports_created": {
+            fmt: str(output_root / Path(path).name)
+            for fmt, path in result.get("exports_created", {}).items()
+        },
+        "cached": True
+    })
+    return result
+
+
+def _store_cached_conversion(cache_dir: Path, output_root: Path, result: Dict[str, Any]) -> None:
+    """Copy a finished output tree and its command result into the cache."""
+    shutil.copytree(output_root, cache_dir / output_root.name, dirs_exist_ok=True)
+    # Written last so a partially copied tree is never treated as a hit
+    save_json(result, cache_dir / "result.json", compact=True)
+
+
+def _prune_conversion_cache(cache_root: Path) -> None:
+    """Drop cache entries past the maximum age, then all but the most recently used."""
+    entries = []
+    with os.scandir(cache_root) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            try:
+                # result.json is touched on every hit; entries without one
+                # are unfinished copies and age by their directory
+                used = os.stat(os.path.join(entry.path, "result.json")).st_mtime
+            except OSError:
+                used = entry.stat().st_mtime
+            entries.append((used, entry.path))
+    
+    entries.sort(reverse=True)
+    cutoff = time.time() - _CACHE_MAX_AGE_SECONDS
+    for position, (used, path) in enumerate(entries):
+        if position >= _CACHE_MAX_ENTRIES or used < cutoff:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _validate_input(input_source: str) -> Tuple[Dict[str, Any], Optional[Any]]:
+    """Validate input source, returning the validation result and the ingestor.
+    
+    The ingestor is None when validation raised, so callers can reuse the
+    populated metadata without probing the source a second time.
+    """
     logger = get_logger()
     
     try:
@@ -261,7 +338,7 @@ def validate_input_command(input_source: str, args: argparse.Namespace) -> Dict[
         }
         
         logger.info(f"Validation successful for: {input_source}")
-        return result
+        return result, ingestor
         
     except (ValidationError, ProcessingError) as e:
         result = {
@@ -272,7 +349,13 @@ def validate_input_command(input_source: str, args: argparse.Namespace) -> Dict[
         }
         
         logger.error(f"Validation failed: {str(e)}")
-        return result
+        return result, None
+
+
+def validate_input_command(input_source: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Validate input source and return validation results."""
+    result, _ = _validate_input(input_source)
+    return result
 
 
 def info_command(input_source: str, args: argparse.Namespace) -> Dict[str, Any]:
@@ -280,15 +363,11 @@ def info_command(input_source: str, args: argparse.Namespace) -> Dict[str, Any]:
     logger = get_logger()
     
     try:
-        # Validate first
-        validation_result = validate_input_command(input_source, args)
+        # Validate first; the validated ingestor already holds the metadata
+        validation_result, ingestor = _validate_input(input_source)
         if not validation_result["valid"]:
             return validation_result
         
-        # For PDF files, get basic info
-        ingestor = create_ingestor(input_source)
-        ingestor.validate()  # This populates metadata
-        
         result = {
             "input_source": input_source,
             "metadata": ingestor.metadata,
@@ -307,13 +386,25 @@ def info_command(input_source: str, args: argparse.Namespace) -> Dict[str, Any]:
         }
 
 
+def _flush_log_handlers(logger: logging.Logger) -> None:
+    """Write out records held by buffering handlers such as MemoryHandler."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def _log_phase(logger: logging.Logger, message: str) -> None:
+    """Log the start of a command phase and flush any buffered records."""
+    logger.info(message)
+    _flush_log_handlers(logger)
+
+
 def convert_command(input_source: str, args: argparse.Namespace, config: Dict[str, Any]) -> Dict[str, Any]:
     """Convert paper to structured data."""
     logger = get_logger()
     
     try:
         # Create ingestor and validate
-        logger.info(f"Starting conversion of: {input_source}")
+        _log_phase(logger, f"Starting conversion of: {input_source}")
         ingestor = create_ingestor(input_source)
         ingestor.validate()
         
@@ -325,22 +416,52 @@ def convert_command(input_source: str, args: argparse.Namespace, config: Dict[st
                 "metadata": ingestor.metadata
             }
         
+        # Determine output directory
+        if args.output:
+            output_dir = args.output
+        else:
+            output_dir = Path(config.get("output", {}).get("directory", "./paper2data_output"))
+        
+        # Reuse a previous conversion of identical input when available
+        use_cache = not getattr(args, "no_cache", False)
+        cache_dir = None
+        if use_cache and Path(input_source).is_file():
+            cache_dir = get_cache_directory() / _conversion_cache_key(get_file_hash(Path(input_source)), args, config)
+            cached_result = _restore_cached_conversion(cache_dir, output_dir, input_source)
+            if cached_result is not None:
+                logger.info(f"Reused cached conversion: {cached_result['output_directory']}")
+                return cached_result
+        
         # Ingest content
-        logger.info("Ingesting content...")
+        _log_phase(logger, "Ingesting content...")
         pdf_content = ingestor.ingest()
         
+        if use_cache and cache_dir is None:
+            content_hash = hashlib.blake2b(pdf_content, digest_size=16).hexdigest()
+            cache_dir = get_cache_directory() / _conversion_cache_key(content_hash, args, config)
+            cached_result = _restore_cached_conversion(cache_dir, output_dir, input_source)
+            if cached_result is not None:
+                logger.info(f"Reused cached conversion: {cached_result['output_directory']}")
+                return cached_result
+        
         # Extract all content
-        logger.info("Extracting content...")
+        _log_phase(logger, "Extracting content...")
         extraction_results = extract_all_content(pdf_content)
         
-        # Determine output directory
-        if args.output:
-            output_dir = args.output
-        else:
-            output_dir = Path(config.get("output", {}).get("directory", "./paper2data_output"))
+        # Resolve the top-level result blocks once and reuse them below
+        content = extraction_results.get("content", {})
+        metadata = content.get("metadata", {})
+        sections_data = extraction_results.get("sections", {})
+        figures_data = extraction_results.get("figures", {})
+        tables_data = extraction_results.get("tables", {})
+        citations_data = extraction_results.get("citations", {})
+        summary = extraction_results.get("summary", {})
+        extraction_timestamp = extraction_results.get("extraction_timestamp", "")
+        all_figures = figures_data.get("figures", [])
+        all_tables = tables_data.get("tables", [])
         
         # Create output structure
-        paper_title = extraction_results.get("content", {}).get("metadata", {}).get("title", "unknown")
+        paper_title = metadata.get("title", "unknown")
         if not paper_title or paper_title == "unknown":
             # Try to get title from filename or URL
             if input_source.endswith('.pdf'):
@@ -351,46 +472,51 @@ def convert_command(input_source: str, args: argparse.Namespace, config: Dict[st
         output_structure = create_output_structure(output_dir, paper_title)
         
         # Save extracted content
-        logger.info("Saving extracted content...")
+        _log_phase(logger, "Saving extracted content...")
         
         # Save metadata
         metadata_file = output_structure["metadata"] / "document_info.json"
-        save_json(extraction_results.get("content", {}).get("metadata", {}), metadata_file)
-        
-        # Save sections
-        sections = extraction_results.get("sections", {}).get("sections", {})
-        for section_name, section_content in sections.items():
-            if section_content:
-                section_file = output_structure["sections"] / f"{section_name}.md"
-                with open(section_file, 'w', encoding='utf-8') as f:
-                    f.write(f"# {section_name.title()}\n\n{section_content}")
+        save_json(metadata, metadata_file)
+        
+        # Collect section, figure and table files and write them together.
+        # Markdown payloads are formatted up front so the worker threads
+        # only do I/O. Paths are plain strings built with os.path.join,
+        # which is much cheaper per file than Path division.
+        join = os.path.join
+        sections_dir = os.fspath(output_structure["sections"])
+        figures_dir = os.fspath(output_structure["figures"])
+        tables_dir = os.fspath(output_structure["tables"])
+        
+        sections = sections_data.get("sections", {})
+        write_tasks = [
+            (join(sections_dir, f"{name}.md"), f"# {name.title()}\n\n{text}")
+            for name, text in sections.items()
+            if text
+        ]
         
         # Save figures (if enabled)
         if not args.no_figures and config.get("processing", {}).get("extract_figures", True):
-            figures = extraction_results.get("figures", {}).get("figures", [])
-            for figure in figures:
-                figure_file = output_structure["figures"] / f"{figure['figure_id']}.png"
-                with open(figure_file, 'wb') as f:
-                    f.write(figure["data"])
+            for figure in all_figures:
+                figure_file = join(figures_dir, f"{figure['figure_id']}.png")
+                write_tasks.append((figure_file, figure["data"]))
         
         # Save tables (if enabled)
         if not args.no_tables and config.get("processing", {}).get("extract_tables", True):
-            tables = extraction_results.get("tables", {}).get("tables", [])
-            for table in tables:
+            for table in all_tables:
                 # Use CSV format if available, otherwise fall back to raw text
                 if 'csv_content' in table and table['csv_content']:
-                    table_file = output_structure["tables"] / f"{table['table_id']}.csv"
-                    with open(table_file, 'w', encoding='utf-8', newline='') as f:
-                        f.write(table["csv_content"])
+                    table_file = join(tables_dir, f"{table['table_id']}.csv")
+                    write_tasks.append((table_file, table["csv_content"]))
                 else:
                     # Fallback to raw text format
-                    table_file = output_structure["tables"] / f"{table['table_id']}.txt"
-                    with open(table_file, 'w', encoding='utf-8') as f:
-                        f.write(table["raw_text"])
+                    table_file = join(tables_dir, f"{table['table_id']}.txt")
+                    write_tasks.append((table_file, table["raw_text"]))
+        
+        _write_output_files(write_tasks)
         
         # Save citations (if enabled)
         if not args.no_citations and config.get("processing", {}).get("extract_citations", True):
-            citations = extraction_results.get("citations", {}).get("reference_list", [])
+            citations = citations_data.get("reference_list", [])
             if citations:
                 citations_file = output_structure["metadata"] / "citations.json"
                 save_json({"references": citations}, citations_file)
@@ -398,33 +524,32 @@ def convert_command(input_source: str, args: argparse.Namespace, config: Dict[st
         # Save comprehensive results (excluding binary data)
         results_file = output_structure["root"] / "extraction_results.json"
         json_safe_results = {
-            "content": extraction_results.get("content", {}),
-            "sections": extraction_results.get("sections", {}),
-            "tables": extraction_results.get("tables", {}),
-            "citations": extraction_results.get("citations", {}),
-            "summary": extraction_results.get("summary", {}),
-            "extraction_timestamp": extraction_results.get("extraction_timestamp", ""),
+            "content": content,
+            "sections": sections_data,
+            "tables": tables_data,
+            "citations": citations_data,
+            "summary": summary,
+            "extraction_timestamp": extraction_timestamp,
             # Note: Figure binary data is saved separately as PNG files
             "figures": {
-                "summary": extraction_results.get("figures", {}).get("summary", {}),
-                "figure_count": len(extraction_results.get("figures", {}).get("figures", []))
+                "summary": figures_data.get("summary", {}),
+                "figure_count": len(all_figures)
             }
         }
-        save_json(json_safe_results, results_file)
+        save_json(json_safe_results, results_file, compact=True)
         
         # Create README
         readme_file = output_structure["root"] / "README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(f"""# {paper_title}
+        readme_file.write_text(f"""# {paper_title}
 
 ## Extraction Summary
 
-- **Pages**: {extraction_results.get('summary', {}).get('total_pages', 'Unknown')}
-- **Words**: {extraction_results.get('summary', {}).get('total_words', 'Unknown')}
-- **Sections**: {extraction_results.get('summary', {}).get('sections_found', 0)}
-- **Figures**: {extraction_results.get('summary', {}).get('figures_found', 0)}
-- **Tables**: {extraction_results.get('summary', {}).get('tables_found', 0)}
-- **References**: {extraction_results.get('summary', {}).get('references_found', 0)}
+- **Pages**: {summary.get('total_pages', 'Unknown')}
+- **Words**: {summary.get('total_words', 'Unknown')}
+- **Sections**: {summary.get('sections_found', 0)}
+- **Figures**: {summary.get('figures_found', 0)}
+- **Tables**: {summary.get('tables_found', 0)}
+- **References**: {summary.get('references_found', 0)}
 
 ## Directory Structure
 
@@ -437,20 +562,20 @@ def convert_command(input_source: str, args: argparse.Namespace, config: Dict[st
 ## Source
 
 Original source: {input_source}
-Processed on: {extraction_results.get('extraction_timestamp', 'Unknown')}
-""")
+Processed on: {extraction_timestamp or 'Unknown'}
+""", encoding='utf-8')
         
         # Multi-format export
         formats = [fmt.strip() for fmt in args.format.split(',')]
         export_results = {}
-        from .utils import format_output
         for fmt in formats:
             try:
                 formatted = format_output(extraction_results, fmt)
                 export_file = output_structure["root"] / f"extraction_results.{fmt if fmt != 'markdown' else 'md'}"
-                mode = 'w' if isinstance(formatted, str) else 'wb'
-                with open(export_file, mode) as f:
-                    f.write(formatted)
+                if isinstance(formatted, str):
+                    export_file.write_text(formatted, encoding='utf-8')
+                else:
+                    export_file.write_bytes(formatted)
                 export_results[fmt] = str(export_file)
                 logger.info(f"Exported {fmt} to {export_file}")
             except Exception as e:
@@ -460,18 +585,25 @@ Processed on: {extraction_results.get('extraction_timestamp', 'Unknown')}
             "success": True,
             "input_source": input_source,
             "output_directory": str(output_structure["root"]),
-            "summary": extraction_results.get("summary", {}),
+            "summary": summary,
             "files_created": {
                 "sections": len(sections),
-                "figures": len(extraction_results.get("figures", {}).get("figures", [])),
-                "tables": len(extraction_results.get("tables", {}).get("tables", [])),
+                "figures": len(all_figures),
+                "tables": len(all_tables),
                 "metadata_files": 2,  # document_info.json + citations.json
                 "exports": len(export_results)
             },
             "exports_created": export_results
         }
         
-        logger.info(f"Conversion completed successfully: {output_structure['root']}")
+        if cache_dir is not None:
+            try:
+                _store_cached_conversion(cache_dir, output_structure["root"], result)
+                _prune_conversion_cache(cache_dir.parent)
+            except OSError as e:
+                logger.warning(f"Could not cache conversion results: {e}")
+        
+        _log_phase(logger, f"Conversion completed successfully: {output_structure['root']}")
         return result
         
     except Exception as e:
@@ -728,11 +860,21 @@ def help_command(args: argparse.Namespace) -> Dict[str, Any]:
         }
 
 
+def _stdout_supports_emoji() -> bool:
+    """Whether stdout is a UTF-8 terminal that can render status emoji."""
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower()
+    return sys.stdout.isatty() and encoding.startswith("utf")
+
+
 def main() -> int:
     """Main entry point."""
     parser = setup_argument_parser()
     args = parser.parse_args()
     
+    # Plain ASCII markers when piped or on non-UTF-8 consoles
+    use_emoji = _stdout_supports_emoji()
+    tick, cross = ("✅", "❌") if use_emoji else ("[OK]", "[FAIL]")
+    
     try:
         # Handle help command early
         if args.command == "help":
@@ -762,7 +904,7 @@ def main() -> int:
         
         # For other commands, validate input is provided
         if not args.input:
-            print("❌ Input is required for this command")
+            print(f"{cross} Input is required for this command")
             print("Use 'paper2data help' for usage examples")
             return 1
         
@@ -775,16 +917,22 @@ def main() -> int:
         
         # Use stderr for logging when JSON output is requested to keep stdout clean
         if args.json_output:
-            import sys
             console_handler = logging.StreamHandler(sys.stderr)
             console_handler.setLevel(getattr(logging, log_level.upper()))
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             console_handler.setFormatter(formatter)
             
+            # Progress messages are only diagnostics in this mode, so batch
+            # them instead of paying for a stderr write per record; warnings
+            # go out at once and each command phase flushes the batch
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=256, flushLevel=logging.WARNING, target=console_handler
+            )
+            
             logger = logging.getLogger("paper2data.parser")
             logger.setLevel(getattr(logging, log_level.upper()))
             logger.handlers.clear()
-            logger.addHandler(console_handler)
+            logger.addHandler(buffered_handler)
             
             if log_file:
                 file_handler = logging.FileHandler(log_file)
@@ -795,7 +943,7 @@ def main() -> int:
             setup_logging(level=log_level, log_file=log_file)
         
         logger = get_logger()
-        logger.info(f"Starting Paper2Data parser - Command: {args.command}")
+        _log_phase(logger, f"Starting Paper2Data parser - Command: {args.command}")
         
         # Execute command
         if args.command == "validate":
@@ -806,21 +954,23 @@ def main() -> int:
             result = convert_command(args.input, args, config)
         else:
             result = {"error": f"Unknown command: {args.command}"}
+        _flush_log_handlers(logger)
         
         # Output results
         if args.json_output:
             print(json.dumps(result, indent=2))
         else:
             if result.get("success", False) or result.get("valid", False):
-                print("✅ Operation completed successfully")
+                print(f"{tick} Operation completed successfully")
                 if "output_directory" in result:
-                    print(f"📂 Output: {result['output_directory']}")
+                    print(f"{'📂 ' if use_emoji else ''}Output: {result['output_directory']}")
                 if "summary" in result:
                     summary = result["summary"]
-                    print(f"📄 {summary.get('total_pages', 0)} pages, {summary.get('total_words', 0)} words")
-                    print(f"📊 {summary.get('sections_found', 0)} sections, {summary.get('figures_found', 0)} figures, {summary.get('tables_found', 0)} tables")
+                    page_icon, stats_icon = ("📄 ", "📊 ") if use_emoji else ("", "")
+                    print(f"{page_icon}{summary.get('total_pages', 0)} pages, {summary.get('total_words', 0)} words")
+                    print(f"{stats_icon}{summary.get('sections_found', 0)} sections, {summary.get('figures_found', 0)} figures, {summary.get('tables_found', 0)} tables")
             else:
-                print("❌ Operation failed")
+                print(f"{cross} Operation failed")
                 if "error" in result:
                     print(f"Error: {result['error']}")
                 print("Use 'paper2data help' for usage examples")
@@ -831,10 +981,10 @@ def main() -> int:
         if args.json_output:
             print(json.dumps({"error": str(e), "success": False}, indent=2))
         else:
-            print(f"❌ Fatal error: {str(e)}")
+            print(f"{cross} Fatal error: {str(e)}")
             print("Use 'paper2data help troubleshooting' for common solutions")
         return 1
 
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main()) 
@@ -9,6 +9,7 @@ import os
 import sys
 import json
 import yaml
+import hashlib
 import logging
 import re
 from pathlib import Path
@@ -17,6 +18,18 @@ from contextlib import contextmanager
 from urllib.parse import urlparse, urlunparse
 import tempfile
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+
 
 @contextmanager
 def suppress_stderr():
@@ -234,12 +247,57 @@ def ensure_directory(path: Path) -> Path:
         raise
 
 
-def save_json(data: Dict[str, Any], filepath: Path) -> None:
+def _orjson_dumps(data: Any, compact: bool) -> Optional[bytes]:
+    """Serialize with orjson, or return None if it is unavailable or refuses the data."""
+    if not ORJSON_AVAILABLE:
+        return None
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+        return None
+
+
+def _json_encoder(compact: bool) -> json.JSONEncoder:
+    """Stdlib encoder matching the orjson output layout."""
+    if compact:
+        return json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    return json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the standard library
+    for anything orjson refuses (e.g. integers wider than 64 bits).
+    
+    Args:
+        data: Data to serialize
+        compact: Omit indentation and extra whitespace
+        
+    Returns:
+        Encoded JSON document
+    """
+    serialized = _orjson_dumps(data, compact)
+    if serialized is not None:
+        return serialized
+    return _json_encoder(compact).encode(data).encode('utf-8')
+
+
+def save_json(data: Dict[str, Any], filepath: Path, compact: bool = False) -> None:
     """Save data as JSON file.
     
+    With orjson the document is serialized to bytes in one call and written
+    once. Otherwise the stdlib encoder streams chunks into a 1 MiB buffered
+    file, so the full serialized string is never held in memory.
+    
     Args:
         data: Data to save
         filepath: Target file path
+        compact: Write without indentation or extra whitespace (for large files)
         
     Raises:
         OSError: If file cannot be written
@@ -249,8 +307,13 @@ def save_json(data: Dict[str, Any], filepath: Path) -> None:
     
     try:
         ensure_directory(filepath.parent)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        serialized = _orjson_dumps(data, compact)
+        if serialized is not None:
+            Path(filepath).write_bytes(serialized)
+        else:
+            chunks = _json_encoder(compact).iterencode(data)
+            with open(filepath, 'wb', buffering=1024 * 1024) as f:
+                f.writelines(chunk.encode('utf-8') for chunk in chunks)
         logger.info(f"JSON saved successfully: {filepath}")
     except OSError as e:
         logger.error(f"Failed to save JSON to {filepath}: {e}")
@@ -337,8 +400,8 @@ def _load_config_legacy(config_path: Optional[Path] = None) -> Dict[str, Any]:
     logger.info(f"Loading configuration from: {config_path}")
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=YAMLSafeLoader)
         
         if not isinstance(config, dict):
             raise ConfigurationError("Configuration file must contain a dictionary")
@@ -360,11 +423,34 @@ def _load_config_legacy(config_path: Optional[Path] = None) -> Dict[str, Any]:
         raise ConfigurationError(f"Cannot read configuration file: {e}")
 
 
-def get_file_hash(filepath: Path) -> str:
-    """Generate hash for file content."""
-    # TODO: Implement file hashing
-    logging.info(f"Generating hash for: {filepath}")
-    raise NotImplementedError("File hashing not yet implemented")
+def get_file_hash(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Generate hash for file content.
+    
+    Uses BLAKE2b with a 16-byte digest. On Python 3.11+ the file is hashed by
+    hashlib.file_digest, which reads into a reused buffer in C; older versions
+    fall back to reading 1 MiB chunks.
+    
+    Args:
+        filepath: Path to the file
+        chunk_size: Number of bytes to read per iteration (fallback only)
+        
+    Returns:
+        Hex digest of the file content
+    """
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def get_cache_directory() -> Path:
+    """Return the per-user cache directory for conversion results."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "paper2data"
 
 
 def progress_callback(current: int, total: int, message: str = "") -> None:
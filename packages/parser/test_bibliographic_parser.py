@@ -10,9 +10,11 @@ This test script verifies the comprehensive bibliographic parsing capabilities i
 - Export functionality (JSON, BibTeX, RIS)
 """
 
+import os
 import sys
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the src directory to Python path
@@ -83,27 +85,33 @@ def test_reference_parsing():
     
     reference = parser.parse_reference(test_reference, "test_ref_001")
     
-    print(f"  Original Text: {test_reference.strip()}")
-    print(f"  Reference ID: {reference.reference_id}")
-    print(f"  Citation Style: {reference.citation_style.value}")
-    print(f"  Reference Type: {reference.reference_type.value}")
-    print(f"  Quality: {reference.quality.value}")
-    print(f"  Title: {reference.title}")
-    print(f"  Authors: {len(reference.authors)}")
+    # Collect the report and write it once
+    lines = [
+        f"  Original Text: {test_reference.strip()}",
+        f"  Reference ID: {reference.reference_id}",
+        f"  Citation Style: {reference.citation_style.value}",
+        f"  Reference Type: {reference.reference_type.value}",
+        f"  Quality: {reference.quality.value}",
+        f"  Title: {reference.title}",
+        f"  Authors: {len(reference.authors)}",
+    ]
     
     for i, author in enumerate(reference.authors):
-        print(f"    Author {i+1}: {author.family_name}, {' '.join(author.given_names)}")
-        print(f"      Normalized: {author.normalized_name}")
-    
-    print(f"  Journal: {reference.journal}")
-    print(f"  Year: {reference.year}")
-    print(f"  Volume: {reference.volume}")
-    print(f"  Issue: {reference.issue}")
-    print(f"  Pages: {reference.pages}")
-    print(f"  DOI: {reference.doi}")
-    print(f"  Completeness Score: {reference.completeness_score:.2f}")
-    print(f"  Accuracy Score: {reference.accuracy_score:.2f}")
-    print(f"  Confidence Score: {reference.confidence_score:.2f}")
+        lines.append(f"    Author {i+1}: {author.family_name}, {' '.join(author.given_names)}")
+        lines.append(f"      Normalized: {author.normalized_name}")
+    
+    lines.extend([
+        f"  Journal: {reference.journal}",
+        f"  Year: {reference.year}",
+        f"  Volume: {reference.volume}",
+        f"  Issue: {reference.issue}",
+        f"  Pages: {reference.pages}",
+        f"  DOI: {reference.doi}",
+        f"  Completeness Score: {reference.completeness_score:.2f}",
+        f"  Accuracy Score: {reference.accuracy_score:.2f}",
+        f"  Confidence Score: {reference.confidence_score:.2f}",
+    ])
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("✅ Reference parsing test completed\n")
 
@@ -222,14 +230,21 @@ def test_full_bibliography_parsing():
             print(f"    {ref_type.replace('_', ' ').title()}: {count}")
     
     # Show individual references
-    for i, ref in enumerate(bibliography.references):
-        print(f"    Reference {i+1}:")
-        print(f"      Title: {ref.title}")
-        print(f"      Authors: {len(ref.authors)}")
-        print(f"      Year: {ref.year}")
-        print(f"      Type: {ref.reference_type.value}")
-        print(f"      Quality: {ref.quality.value}")
-        print(f"      Confidence: {ref.confidence_score:.2f}")
+    reference_template = (
+        "    Reference {}:\n"
+        "      Title: {}\n"
+        "      Authors: {}\n"
+        "      Year: {}\n"
+        "      Type: {}\n"
+        "      Quality: {}\n"
+        "      Confidence: {:.2f}\n"
+    )
+    lines = []
+    for i, ref in enumerate(bibliography.references, 1):
+        title, author_count, year = ref.title, len(ref.authors), ref.year
+        ref_type, quality, confidence = ref.reference_type.value, ref.quality.value, ref.confidence_score
+        lines.append(reference_template.format(i, title, author_count, year, ref_type, quality, confidence))
+    sys.stdout.write("".join(lines))
     
     print("✅ Full bibliography parsing test completed\n")
 
@@ -350,7 +365,9 @@ def test_performance_benchmarks():
     """Test performance with different bibliography sizes."""
     print("⚡ Testing Performance Benchmarks...")
     
-    parser = create_bibliographic_parser()
+    # Each size is timed several times and the fastest run reported, which
+    # filters out scheduler and GC noise on these millisecond-scale runs
+    repeats = 5
     
     # Test with different sizes
     test_sizes = [
@@ -360,23 +377,43 @@ def test_performance_benchmarks():
         ("Very Large", 100)
     ]
     
+    # Number the reference lines once for the largest size and slice per size
+    base_ref = "Smith, J. A. (2023). Machine learning research. Nature, 601, 123-130."
+    max_refs = max(ref_count for _, ref_count in test_sizes)
+    numbered_refs = [f"{i+1}. {base_ref}\n" for i in range(max_refs)]
+    
     for size_name, ref_count in test_sizes:
         # Generate bibliography text
-        base_ref = "Smith, J. A. (2023). Machine learning research. Nature, 601, 123-130."
-        
-        bibliography_text = "References:\n\n"
-        for i in range(ref_count):
-            bibliography_text += f"{i+1}. {base_ref}\n"
+        bibliography_text = "References:\n\n" + "".join(numbered_refs[:ref_count])
         
-        # Time the parsing
-        start_time = time.time()
-        bibliography = parser.parse_bibliography(bibliography_text)
-        parsing_time = time.time() - start_time
+        # Time the parsing with a fresh parser per run, so neither the
+        # accumulated database nor the reference cache carries over
+        best_ns = None
+        for _ in range(repeats):
+            parser = create_bibliographic_parser()
+            start_ns = time.perf_counter_ns()
+            bibliography = parser.parse_bibliography(bibliography_text)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            best_ns = elapsed_ns if best_ns is None else min(best_ns, elapsed_ns)
         
-        print(f"  {size_name} ({ref_count} refs): {parsing_time:.4f}s")
+        print(f"  {size_name} ({ref_count} refs): {best_ns / 1e6:.3f}ms (best of {repeats}), "
+              f"{best_ns / ref_count / 1e3:.1f}µs/ref")
         print(f"    Parsed: {len(bibliography.references)} references")
         print(f"    Avg quality: {bibliography.quality_metrics.get('average_confidence', 0):.2f}")
     
+    # References parse independently, so large batches can be spread over processes
+    entries = [base_ref] * max_refs
+    workers = min(4, os.cpu_count() or 1)
+    start_ns = time.perf_counter_ns()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parallel_refs = list(executor.map(ReferenceParser().parse_reference, entries,
+                                          chunksize=max(1, max_refs // workers)))
+    parsing_ns = time.perf_counter_ns() - start_ns
+    
+    print(f"  Process pool ({max_refs} refs, {workers} workers): {parsing_ns / 1e6:.3f}ms")
+    assert len(parallel_refs) == max_refs
+    assert all(ref.year == 2023 for ref in parallel_refs)
+    
     print("✅ Performance benchmarks completed\n")
 
 def test_reference_quality_assessment():
@@ -410,62 +447,71 @@ def test_reference_quality_assessment():
     for i, ref_text in enumerate(test_references):
         reference = parser.parse_reference(ref_text, f"quality_test_{i+1}")
         
-        print(f"  Reference {i+1}:")
-        print(f"    Text: {ref_text.strip()[:50]}...")
-        print(f"    Quality: {reference.quality.value}")
-        print(f"    Completeness: {reference.completeness_score:.2f}")
-        print(f"    Accuracy: {reference.accuracy_score:.2f}")
-        print(f"    Confidence: {reference.confidence_score:.2f}")
-        print()
+        sys.stdout.write(
+            f"  Reference {i+1}:\n"
+            f"    Text: {ref_text.strip()[:50]}...\n"
+            f"    Quality: {reference.quality.value}\n"
+            f"    Completeness: {reference.completeness_score:.2f}\n"
+            f"    Accuracy: {reference.accuracy_score:.2f}\n"
+            f"    Confidence: {reference.confidence_score:.2f}\n"
+            "\n"
+        )
     
     print("✅ Reference quality assessment test completed\n")
 
+# Each test paired with its label in the summary; main() runs them in order
+_TEST_SUITE = (
+    ("Citation style detection", test_citation_style_detection),
+    ("Reference parsing", test_reference_parsing),
+    ("Bibliographic normalization", test_bibliographic_normalization),
+    ("Citation formatting", test_citation_formatting),
+    ("Full bibliography parsing", test_full_bibliography_parsing),
+    ("Export capabilities", test_export_capabilities),
+    ("Integration", test_integration_with_enhanced_metadata),
+    ("Performance benchmarks", test_performance_benchmarks),
+    ("Quality assessment", test_reference_quality_assessment),
+)
+
 def main():
-    """Run all bibliographic parser tests."""
+    """Run all bibliographic parser tests.
+    
+    Each test runs in isolation, so a failure is recorded and reported
+    without aborting the tests after it.
+    """
     print("🧪 Paper2Data Advanced Bibliographic Parser Test Suite")
     print("=" * 70)
     
     start_time = time.time()
     
-    try:
-        # Run individual tests
-        test_citation_style_detection()
-        test_reference_parsing()
-        test_bibliographic_normalization()
-        test_citation_formatting()
-        test_full_bibliography_parsing()
-        test_export_capabilities()
-        test_integration_with_enhanced_metadata()
-        test_performance_benchmarks()
-        test_reference_quality_assessment()
-        
-        total_time = time.time() - start_time
-        
-        print("=" * 70)
+    failures = {}
+    for label, test in _TEST_SUITE:
+        try:
+            test()
+        except Exception as e:
+            failures[label] = f"{type(e).__name__}: {e}"
+            print(f"❌ {label} failed with error: {failures[label]}")
+    
+    total_time = time.time() - start_time
+    
+    print("=" * 70)
+    if failures:
+        print(f"❌ {len(failures)} of {len(_TEST_SUITE)} Bibliographic Parser tests failed")
+    else:
         print(f"✅ All Bibliographic Parser tests completed successfully!")
-        print(f"⏱️ Total execution time: {total_time:.2f} seconds")
+    print(f"⏱️ Total execution time: {total_time:.2f} seconds")
+    if not failures:
         print("\n🎉 Advanced Bibliographic Parser V1.1 is ready for production!")
-        
-        # Success statistics
-        print("\n📊 Test Results Summary:")
-        print("  ✅ Citation style detection: PASSED")
-        print("  ✅ Reference parsing: PASSED")
-        print("  ✅ Bibliographic normalization: PASSED")
-        print("  ✅ Citation formatting: PASSED")
-        print("  ✅ Full bibliography parsing: PASSED")
-        print("  ✅ Export capabilities: PASSED")
-        print("  ✅ Integration: PASSED")
-        print("  ✅ Performance benchmarks: PASSED")
-        print("  ✅ Quality assessment: PASSED")
-        
-    except Exception as e:
-        print(f"❌ Test failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
     
-    return True
+    # Per-test results
+    print("\n📊 Test Results Summary:")
+    for label, _ in _TEST_SUITE:
+        if label in failures:
+            print(f"  ❌ {label}: FAILED")
+        else:
+            print(f"  ✅ {label}: PASSED")
+    
+    return not failures
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
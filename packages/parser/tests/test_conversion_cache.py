@@ -0,0 +1,140 @@
+"""
+Tests for the convert command's conversion cache.
+
+Ingestion and extraction are mocked so the tests only exercise cache keys,
+hits, misses, pruning and the --no-cache flag.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from paper2data import main
+from paper2data.utils import get_file_hash
+
+
+EXTRACTION_RESULTS = {
+    "content": {"metadata": {"title": "Cached Paper"}},
+    "sections": {"sections": {"introduction": "Some text."}},
+    "figures": {"figures": []},
+    "tables": {"tables": []},
+    "citations": {"reference_list": []},
+    "summary": {"total_pages": 1},
+    "extraction_timestamp": "2024-01-01T00:00:00",
+}
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """Isolated cache directory, input PDF and mocked ingestion/extraction."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    pdf_file = tmp_path / "paper.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\n%fake pdf content\n%%EOF")
+
+    ingestor = Mock()
+    ingestor.ingest.return_value = pdf_file.read_bytes()
+    ingestor.metadata = {}
+    extract = Mock(return_value=EXTRACTION_RESULTS)
+
+    with patch("paper2data.main.create_ingestor", return_value=ingestor), \
+         patch("paper2data.main.extract_all_content", extract):
+        yield pdf_file, extract, tmp_path
+
+
+def _convert(pdf_file, output_dir, *flags):
+    args = main.setup_argument_parser().parse_args(
+        ["convert", str(pdf_file), "-o", str(output_dir), *flags]
+    )
+    return main.convert_command(str(pdf_file), args, {})
+
+
+class TestFileHash:
+    """Test content hashing of input files."""
+
+    def test_hash_depends_on_content_only(self, tmp_path):
+        """Identical content hashes equal; different content does not."""
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        third = tmp_path / "c.pdf"
+        first.write_bytes(b"same content")
+        second.write_bytes(b"same content")
+        third.write_bytes(b"other content")
+
+        assert get_file_hash(first) == get_file_hash(second)
+        assert get_file_hash(first) != get_file_hash(third)
+        assert len(get_file_hash(first)) == 32
+
+
+class TestConversionCache:
+    """Test reuse of cached conversions."""
+
+    def test_cache_hit_restores_output(self, cache_env):
+        """A second conversion of the same input is served from the cache."""
+        pdf_file, extract, tmp_path = cache_env
+
+        first = _convert(pdf_file, tmp_path / "out1")
+        second = _convert(pdf_file, tmp_path / "out2")
+
+        assert first["success"] and "cached" not in first
+        assert second["cached"] is True
+        assert extract.call_count == 1
+
+        output_root = Path(second["output_directory"])
+        assert output_root.parent == tmp_path / "out2"
+        assert (output_root / "README.md").is_file()
+        for path in second["exports_created"].values():
+            assert Path(path).parent == output_root
+            assert Path(path).is_file()
+
+    def test_option_change_misses_cache(self, cache_env):
+        """Changing an output-shaping option forces a fresh extraction."""
+        pdf_file, extract, tmp_path = cache_env
+
+        _convert(pdf_file, tmp_path / "out1")
+        result = _convert(pdf_file, tmp_path / "out2", "--no-tables")
+
+        assert "cached" not in result
+        assert extract.call_count == 2
+
+    def test_version_change_misses_cache(self, cache_env, monkeypatch):
+        """Output cached by another parser version is not reused."""
+        pdf_file, extract, tmp_path = cache_env
+
+        _convert(pdf_file, tmp_path / "out1")
+        monkeypatch.setattr(main, "__version__", "0.0.0-other")
+        result = _convert(pdf_file, tmp_path / "out2")
+
+        assert "cached" not in result
+        assert extract.call_count == 2
+
+    def test_no_cache_flag_skips_cache(self, cache_env):
+        """--no-cache neither reads nor writes the cache."""
+        pdf_file, extract, tmp_path = cache_env
+
+        _convert(pdf_file, tmp_path / "out1", "--no-cache")
+        result = _convert(pdf_file, tmp_path / "out2")
+
+        assert "cached" not in result
+        assert extract.call_count == 2
+
+        result = _convert(pdf_file, tmp_path / "out3", "--no-cache")
+        assert "cached" not in result
+        assert extract.call_count == 3
+
+    def test_prune_keeps_most_recent_entries(self, tmp_path, monkeypatch):
+        """Pruning drops stale entries and caps the entry count."""
+        monkeypatch.setattr(main, "_CACHE_MAX_ENTRIES", 2)
+        now = main.time.time()
+        ages = {"newest": 0, "newer": 10, "older": 20, "stale": main._CACHE_MAX_AGE_SECONDS + 10}
+        for name, age in ages.items():
+            entry = tmp_path / name
+            entry.mkdir()
+            result_file = entry / "result.json"
+            result_file.write_text("{}")
+            os.utime(result_file, (now - age, now - age))
+
+        main._prune_conversion_cache(tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["newer", "newest"]
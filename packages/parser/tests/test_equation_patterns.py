@@ -0,0 +1,28 @@
+"""
+Tests for the precompiled equation detection patterns.
+
+Covers how EquationProcessor scans whole-page text with the module-level
+patterns shared by every detector instance.
+"""
+
+from paper2data.equation_processor import EquationProcessor
+
+
+class TestNumberedEquationPatterns:
+    """Test numbered-equation detection on page text."""
+
+    def _numbered(self, text):
+        processor = EquationProcessor()
+        return [eq for eq in processor._process_page_text(text, 1) if eq.equation_type == "numbered"]
+
+    def test_line_final_citation_year_not_numbered(self):
+        """A parenthesised year ending a line is not an equation number."""
+        text = "As shown by Smith et al. (2019)\nthe method converges quickly."
+        assert self._numbered(text) == []
+
+    def test_equation_environment_detected(self):
+        """LaTeX equation environments are detected as numbered equations."""
+        text = "We have \\begin{equation} E = mc^2 \\end{equation} as expected."
+        numbered = self._numbered(text)
+        assert len(numbered) == 1
+        assert numbered[0].text_content.startswith("\\begin{equation}")
@@ -0,0 +1,61 @@
+"""
+Tests for the command functions behind the parser CLI.
+
+The Node.js CLI reads the JSON these commands return, so the tests pin the
+result shape. Ingestion and extraction are mocked.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from paper2data import main
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    """Input PDF in a temporary directory."""
+    pdf_file = tmp_path / "paper.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4\n%fake pdf content\n%%EOF")
+    return pdf_file
+
+
+def _convert(pdf_file, output_dir, *flags):
+    args = main.setup_argument_parser().parse_args(
+        ["convert", str(pdf_file), "-o", str(output_dir), *flags]
+    )
+    return main.convert_command(str(pdf_file), args, {})
+
+
+class TestConvertDryRun:
+    """Test the result shape of convert --dry-run."""
+
+    def test_valid_input_succeeds_without_extraction(self, pdf_file, tmp_path):
+        """A valid input reports success and never extracts."""
+        ingestor = Mock()
+        ingestor.metadata = {"pages": 1}
+
+        with patch("paper2data.main.create_ingestor", return_value=ingestor), \
+             patch("paper2data.main.extract_all_content") as extract:
+            result = _convert(pdf_file, tmp_path / "out", "--dry-run")
+
+        assert result == {
+            "success": True,
+            "input_source": str(pdf_file),
+            "message": "Dry run completed - input is valid",
+            "metadata": {"pages": 1},
+        }
+        ingestor.ingest.assert_not_called()
+        extract.assert_not_called()
+
+    def test_invalid_input_keeps_conversion_failure_shape(self, pdf_file, tmp_path):
+        """Any validation error is reported as a failed conversion."""
+        with patch("paper2data.main.create_ingestor", side_effect=RuntimeError("boom")):
+            result = _convert(pdf_file, tmp_path / "out", "--dry-run")
+
+        assert result == {
+            "success": False,
+            "input_source": str(pdf_file),
+            "error": "boom",
+            "message": "Conversion failed",
+        }
@@ -8,11 +8,20 @@ Sets up both Python parser and Node.js CLI packages.
 
 import sys
 import subprocess
-import shutil
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 
+# Platform layout, resolved once
+IS_WINDOWS = platform.system() == "Windows"
+VENV_BIN = Path("Scripts" if IS_WINDOWS else "bin")
+EXE_SUFFIX = ".exe" if IS_WINDOWS else ""
+
+# Serialises console output while environment setup steps run concurrently
+_OUTPUT_LOCK = threading.Lock()
+
 def print_status(message: str, status: str = "info"):
     """Print colored status messages."""
     colors = {
@@ -34,55 +43,80 @@ def print_status(message: str, status: str = "info"):
     symbol = symbols.get(status, "•")
     reset = colors["reset"]
     
-    print(f"{color}{symbol} {message}{reset}")
+    with _OUTPUT_LOCK:
+        print(f"{color}{symbol} {message}{reset}")
+
+def _command_tag(command: list) -> str:
+    """Short name of the tool a command runs, e.g. pip, npm or pytest."""
+    if len(command) > 2 and command[1] == "-m":
+        return command[2]
+    return Path(command[0]).stem
 
-def run_command(command: list, cwd: Path = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
+def run_command(command: list, cwd: Path = None, check: bool = True,
+                capture: bool = False) -> subprocess.CompletedProcess:
+    """Run a command and return the result.
+    
+    Output is streamed line by line as it is produced, so long installs show
+    progress without being buffered in memory. Each line is tagged with the
+    tool that wrote it, since setup steps may stream at the same time. Pass
+    capture=True for short commands whose output the caller needs (e.g.
+    version checks).
+    """
     try:
         print_status(f"Running: {' '.join(command)}", "info")
-        result = subprocess.run(
+        if capture:
+            result = subprocess.run(
+                command,
+                cwd=cwd,
+                check=check,
+                capture_output=True,
+                text=True
+            )
+            if result.stdout:
+                with _OUTPUT_LOCK:
+                    print(f"  Output: {result.stdout.strip()}")
+            return result
+        
+        tag = _command_tag(command)
+        with subprocess.Popen(
             command,
             cwd=cwd,
-            check=check,
-            capture_output=True,
-            text=True
-        )
-        if result.stdout:
-            print(f"  Output: {result.stdout.strip()}")
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as process:
+            for line in process.stdout:
+                with _OUTPUT_LOCK:
+                    print(f"  [{tag}] {line}", end="")
+        
+        result = subprocess.CompletedProcess(command, process.returncode)
+        if check:
+            result.check_returncode()
         return result
     except subprocess.CalledProcessError as e:
         print_status(f"Command failed: {e}", "error")
         if e.stderr:
-            print(f"  Error: {e.stderr.strip()}")
+            with _OUTPUT_LOCK:
+                print(f"  Error: {e.stderr.strip()}")
         raise
 
 def check_prerequisites():
     """Check if required tools are installed."""
     print_status("Checking prerequisites...", "info")
     
-    # Check Python 3.10+
-    try:
-        result = run_command(["python3", "--version"], check=False)
-        version_str = result.stdout.strip()
-        if result.returncode == 0:
-            # Extract version number
-            version_parts = version_str.split()[1].split('.')
-            major, minor = int(version_parts[0]), int(version_parts[1])
-            if major >= 3 and minor >= 10:
-                print_status(f"Python version: {version_str}", "success")
-            else:
-                print_status(f"Python 3.10+ required, found: {version_str}", "error")
-                return False
-        else:
-            print_status("Python 3 not found", "error")
-            return False
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        print_status("Python 3 not found", "error")
+    # Check Python 3.10+ (the interpreter running this script, which is also
+    # the one used to create the virtual environment)
+    version_str = f"Python {sys.version.split()[0]}"
+    if sys.version_info >= (3, 10):
+        print_status(f"Python version: {version_str}", "success")
+    else:
+        print_status(f"Python 3.10+ required, found: {version_str}", "error")
         return False
     
     # Check Node.js 16+
     try:
-        result = run_command(["node", "--version"], check=False)
+        result = run_command(["node", "--version"], check=False, capture=True)
         version_str = result.stdout.strip()
         if result.returncode == 0:
             # Extract version number
@@ -102,7 +136,7 @@ def check_prerequisites():
     
     # Check npm
     try:
-        result = run_command(["npm", "--version"], check=False)
+        result = run_command(["npm", "--version"], check=False, capture=True)
         if result.returncode == 0:
             print_status(f"npm version: {result.stdout.strip()}", "success")
         else:
@@ -114,7 +148,7 @@ def check_prerequisites():
     
     # Check git
     try:
-        result = run_command(["git", "--version"], check=False)
+        result = run_command(["git", "--version"], check=False, capture=True)
         if result.returncode == 0:
             print_status(f"Git version: {result.stdout.strip()}", "success")
         else:
@@ -134,19 +168,14 @@ def setup_python_environment():
     # Create virtual environment
     if not venv_dir.exists():
         print_status("Creating Python virtual environment...", "info")
-        run_command(["python3", "-m", "venv", "venv"], cwd=parser_dir)
+        run_command([sys.executable, "-m", "venv", "venv"], cwd=parser_dir)
     else:
         print_status("Virtual environment already exists", "success")
     
     # Determine activation script based on platform
-    if platform.system() == "Windows":
-        activate_script = venv_dir / "Scripts" / "activate"
-        python_exe = venv_dir / "Scripts" / "python.exe"
-        pip_exe = venv_dir / "Scripts" / "pip.exe"
-    else:
-        activate_script = venv_dir / "bin" / "activate"
-        python_exe = venv_dir / "bin" / "python"
-        pip_exe = venv_dir / "bin" / "pip"
+    activate_script = venv_dir / VENV_BIN / "activate"
+    python_exe = venv_dir / VENV_BIN / f"python{EXE_SUFFIX}"
+    pip_exe = venv_dir / VENV_BIN / f"pip{EXE_SUFFIX}"
     
     # Install dependencies
     print_status("Installing Python dependencies...", "info")
@@ -187,10 +216,7 @@ def run_tests():
         parser_dir = Path("packages/parser")
         
         # Use virtual environment python
-        if platform.system() == "Windows":
-            python_exe = parser_dir / "venv" / "Scripts" / "python.exe"
-        else:
-            python_exe = parser_dir / "venv" / "bin" / "python"
+        python_exe = parser_dir / "venv" / VENV_BIN / f"python{EXE_SUFFIX}"
         
         run_command([str(python_exe), "-m", "pytest", "-v"], cwd=parser_dir)
         print_status("Python tests passed", "success")
@@ -211,7 +237,7 @@ def run_tests():
     # Test integration
     try:
         print_status("Testing CLI-Python integration...", "info")
-        run_command(["python3", "tests/integration_test.py"])
+        run_command([sys.executable, "tests/integration_test.py"])
         print_status("Integration tests passed", "success")
     except subprocess.CalledProcessError:
         print_status("Integration tests failed", "error")
@@ -255,7 +281,7 @@ def print_usage_instructions():
     print("="*60)
     
     print("\n🐍 Python Package Usage:")
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         print("  # Activate virtual environment")
         print("  cd packages/parser")
         print("  venv\\Scripts\\activate")
@@ -314,9 +340,13 @@ def main():
         sys.exit(1)
     
     try:
-        # Setup environments
-        python_exe, pip_exe, activate_script = setup_python_environment()
-        setup_nodejs_environment()
+        # Setup environments; the pip and npm installs are independent, so
+        # they run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            python_setup = executor.submit(setup_python_environment)
+            nodejs_setup = executor.submit(setup_nodejs_environment)
+            python_exe, pip_exe, activate_script = python_setup.result()
+            nodejs_setup.result()
         
         # Create sample config
         create_sample_config()
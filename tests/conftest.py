@@ -6,31 +6,19 @@ for the entire test suite.
 """
 
 import pytest
-import tempfile
+import importlib.util
 import json
-import time
-import psutil
 import os
+import re
 import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, Any, List, Optional
-from unittest.mock import Mock, MagicMock
 
-# Add source directories to path for testing
 ROOT_DIR = Path(__file__).parent.parent
-sys.path.insert(0, str(ROOT_DIR / "packages" / "parser" / "src"))
-sys.path.insert(0, str(ROOT_DIR / "packages" / "cli" / "src"))
-
-# Import after path setup
-try:
-    from paper2data.extractor import (
-        ContentExtractor, SectionExtractor, FigureExtractor, 
-        TableExtractor, CitationExtractor
-    )
-    from paper2data.table_processor import TableProcessor
-    from paper2data.utils import setup_logging, get_logger
-except ImportError as e:
-    pytest.skip(f"Could not import paper2data modules: {e}", allow_module_level=True)
+
+# paper2data is imported inside the fixtures that need it, so collection-only
+# runs (e.g. IDE test discovery) never load its import graph
 
 
 # Test Data and Fixtures
@@ -62,10 +50,7 @@ def sample_table_text():
     XGBoost    CIFAR-10   0.701      0.698      201.3"""
 
 
-@pytest.fixture(scope="session")
-def sample_section_text():
-    """Sample academic paper text with sections for testing."""
-    return """
+_SAMPLE_SECTION_TEXT = """
 # Abstract
 
 This paper presents a novel approach to machine learning that significantly
@@ -107,6 +92,12 @@ for future research.
 """
 
 
+@pytest.fixture(scope="session")
+def sample_section_text():
+    """Sample academic paper text with sections for testing."""
+    return _SAMPLE_SECTION_TEXT
+
+
 @pytest.fixture(scope="session")
 def sample_citations():
     """Sample citations for testing citation extraction."""
@@ -135,39 +126,68 @@ def sample_citations():
 # Extractor Fixtures
 # ==================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def content_extractor(sample_pdf_bytes):
-    """Content extractor instance for testing."""
-    return ContentExtractor(sample_pdf_bytes)
+    """Content extractor instance shared by the tests of a module."""
+    from paper2data.extractor import ContentExtractor
+    extractor = ContentExtractor(sample_pdf_bytes)
+    yield extractor
+    extractor._close_document()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def section_extractor(sample_pdf_bytes):
-    """Section extractor instance for testing."""
-    return SectionExtractor(sample_pdf_bytes)
+    """Section extractor instance shared by the tests of a module."""
+    from paper2data.extractor import SectionExtractor
+    extractor = SectionExtractor(sample_pdf_bytes)
+    yield extractor
+    extractor._close_document()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def figure_extractor(sample_pdf_bytes):
-    """Figure extractor instance for testing."""
-    return FigureExtractor(sample_pdf_bytes)
+    """Figure extractor instance shared by the tests of a module."""
+    from paper2data.extractor import FigureExtractor
+    extractor = FigureExtractor(sample_pdf_bytes)
+    yield extractor
+    extractor._close_document()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def table_extractor(sample_pdf_bytes):
-    """Table extractor instance for testing."""
-    return TableExtractor(sample_pdf_bytes)
+    """Table extractor instance shared by the tests of a module."""
+    from paper2data.extractor import TableExtractor
+    extractor = TableExtractor(sample_pdf_bytes)
+    yield extractor
+    extractor._close_document()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def citation_extractor(sample_pdf_bytes):
-    """Citation extractor instance for testing."""
-    return CitationExtractor(sample_pdf_bytes)
+    """Citation extractor instance shared by the tests of a module."""
+    from paper2data.extractor import CitationExtractor
+    extractor = CitationExtractor(sample_pdf_bytes)
+    yield extractor
+    extractor._close_document()
+
+
+_EXTRACTOR_FIXTURES = frozenset({
+    "content_extractor", "section_extractor", "figure_extractor",
+    "table_extractor", "citation_extractor",
+})
+
+
+@pytest.fixture(autouse=True)
+def reset_extractor_state(request):
+    """Give every test a clean view of the module-scoped extractors."""
+    for name in _EXTRACTOR_FIXTURES.intersection(request.fixturenames):
+        request.getfixturevalue(name).extracted_data = {}
 
 
 @pytest.fixture
 def table_processor():
     """Table processor instance for testing."""
+    from paper2data.table_processor import TableProcessor
     return TableProcessor()
 
 
@@ -177,7 +197,15 @@ def table_processor():
 @pytest.fixture
 def performance_monitor():
     """Monitor for performance testing."""
+    # Imported here so sessions that never request this fixture skip psutil
+    import time
+    import psutil
+    
     class PerformanceMonitor:
+        # On Linux the resident page count is read straight from
+        # /proc/self/statm, which is far cheaper than psutil's status parse
+        _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 0
+        
         def __init__(self):
             self.start_time = None
             self.end_time = None
@@ -185,15 +213,25 @@ def performance_monitor():
             self.end_memory = None
             self.process = psutil.Process()
         
+        def _rss(self):
+            """Resident set size in bytes."""
+            if self._PAGE_SIZE:
+                try:
+                    with open('/proc/self/statm', 'rb') as statm:
+                        return int(statm.read().split()[1]) * self._PAGE_SIZE
+                except OSError:
+                    pass
+            return self.process.memory_info().rss
+        
         def start(self):
             """Start monitoring performance."""
             self.start_time = time.perf_counter()
-            self.start_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+            self.start_memory = self._rss() / 1024 / 1024  # MB
         
         def stop(self):
             """Stop monitoring and return metrics."""
             self.end_time = time.perf_counter()
-            self.end_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+            self.end_memory = self._rss() / 1024 / 1024  # MB
             
             return {
                 'execution_time_seconds': self.end_time - self.start_time,
@@ -204,20 +242,24 @@ def performance_monitor():
     return PerformanceMonitor()
 
 
-@pytest.fixture
+# Built once per session; ASCII-only, so CPython stores one byte per character
+_BENCHMARK_DATA = MappingProxyType({
+    'small_document': "A" * 1000,      # 1KB
+    'medium_document': "B" * 100000,   # 100KB  
+    'large_document': "C" * 1000000,   # 1MB
+    'complex_table': "\n".join([
+        "Col1\tCol2\tCol3\tCol4\tCol5\tCol6\tCol7\tCol8\tCol9\tCol10"
+    ] + [
+        f"Row{i}\t{i}\t{i*2}\t{i*3}\t{i*4}\t{i*5}\t{i*6}\t{i*7}\t{i*8}\t{i*9}"
+        for i in range(100)
+    ])
+})
+
+
+@pytest.fixture(scope="session")
 def benchmark_data():
-    """Standard benchmark data for performance tests."""
-    return {
-        'small_document': "A" * 1000,      # 1KB
-        'medium_document': "B" * 100000,   # 100KB  
-        'large_document': "C" * 1000000,   # 1MB
-        'complex_table': "\n".join([
-            "Col1\tCol2\tCol3\tCol4\tCol5\tCol6\tCol7\tCol8\tCol9\tCol10"
-        ] + [
-            f"Row{i}\t{i}\t{i*2}\t{i*3}\t{i*4}\t{i*5}\t{i*6}\t{i*7}\t{i*8}\t{i*9}"
-            for i in range(100)
-        ])
-    }
+    """Standard benchmark data for performance tests (read-only, shared)."""
+    return _BENCHMARK_DATA
 
 
 # File System Fixtures
@@ -226,6 +268,8 @@ def benchmark_data():
 @pytest.fixture
 def temp_output_dir():
     """Temporary directory for test outputs."""
+    import tempfile
+    
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
 
@@ -242,7 +286,9 @@ def golden_standards_dir():
 @pytest.fixture
 def mock_pdf_document():
     """Mock PyMuPDF document for testing without real PDFs."""
-    mock_doc = Mock()
+    from unittest.mock import MagicMock
+    
+    mock_doc = MagicMock()
     mock_doc.page_count = 10
     mock_doc.metadata = {
         'title': 'Test Paper',
@@ -251,17 +297,18 @@ def mock_pdf_document():
         'creator': 'Test Creator'
     }
     
-    # Mock pages
-    mock_pages = []
-    for i in range(10):
-        mock_page = Mock()
-        mock_page.number = i
-        mock_page.get_text.return_value = f"Page {i+1} content with some test text."
-        mock_page.get_images.return_value = []
-        mock_pages.append(mock_page)
+    # Plain namespaces are much cheaper to build than one Mock per page
+    def _page(i):
+        text = f"Page {i+1} content with some test text."
+        return SimpleNamespace(
+            number=i,
+            get_text=lambda *args, **kwargs: text,
+            get_images=lambda *args, **kwargs: [],
+        )
     
-    mock_doc.__getitem__ = lambda self, idx: mock_pages[idx]
-    mock_doc.__iter__ = lambda self: iter(mock_pages)
+    mock_pages = [_page(i) for i in range(10)]
+    mock_doc.__getitem__.side_effect = mock_pages.__getitem__
+    mock_doc.__iter__.side_effect = lambda: iter(mock_pages)
     
     return mock_doc
 
@@ -269,6 +316,10 @@ def mock_pdf_document():
 # Test Utilities
 # ===============
 
+_TABLE_REQUIRED_KEYS = frozenset({'table_id', 'column_count', 'row_count'})
+_CSV_REQUIRED_KEYS = frozenset({'csv_content', 'format'})
+
+
 @pytest.fixture
 def assert_table_structure():
     """Utility function to assert table structure."""
@@ -277,15 +328,14 @@ def assert_table_structure():
                                expected_rows: int,
                                has_csv: bool = True):
         """Assert that table data has expected structure."""
-        assert 'table_id' in table_data
-        assert 'column_count' in table_data
-        assert 'row_count' in table_data
+        missing = _TABLE_REQUIRED_KEYS - table_data.keys()
+        assert not missing, f"Table data missing keys: {sorted(missing)}"
         assert table_data['column_count'] == expected_columns
         assert table_data['row_count'] == expected_rows
         
         if has_csv:
-            assert 'csv_content' in table_data
-            assert 'format' in table_data
+            missing = _CSV_REQUIRED_KEYS - table_data.keys()
+            assert not missing, f"Table data missing CSV keys: {sorted(missing)}"
             assert table_data['format'] == 'csv'
     
     return _assert_table_structure
@@ -298,17 +348,16 @@ def assert_extraction_quality():
                                  min_sections: int = 1,
                                  min_confidence: float = 0.5):
         """Assert that extraction results meet quality standards."""
-        if 'sections' in results:
-            sections = results['sections']
-            if isinstance(sections, dict) and 'sections' in sections:
-                assert len(sections['sections']) >= min_sections
+        # One lookup per key; a missing key and a non-dict value both skip
+        sections = results.get('sections')
+        if isinstance(sections, dict) and 'sections' in sections:
+            assert len(sections['sections']) >= min_sections
         
-        if 'tables' in results:
-            tables = results['tables']
-            if isinstance(tables, dict) and 'tables' in tables:
-                for table in tables['tables']:
-                    if 'confidence' in table:
-                        assert table['confidence'] >= min_confidence
+        tables = results.get('tables')
+        if isinstance(tables, dict) and 'tables' in tables:
+            for table in tables['tables']:
+                if 'confidence' in table:
+                    assert table['confidence'] >= min_confidence
     
     return _assert_extraction_quality
 
@@ -319,6 +368,7 @@ def assert_extraction_quality():
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_logging():
     """Set up logging for test sessions."""
+    from paper2data.utils import setup_logging, get_logger
     try:
         setup_logging(level="DEBUG")
         logger = get_logger()
@@ -332,6 +382,14 @@ def setup_test_logging():
 # Pytest Hooks
 # =============
 
+def pytest_sessionstart(session):
+    """Make paper2data importable before any test module is collected."""
+    # Use the installed package (pip install -e packages/parser, as set up by
+    # setup_dev.py); only a checkout without it falls back to the source tree
+    if importlib.util.find_spec("paper2data") is None:
+        sys.path.insert(0, str(ROOT_DIR / "packages" / "parser" / "src"))
+
+
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     # Ensure test data directory exists
@@ -343,19 +401,26 @@ def pytest_configure(config):
     golden_dir.mkdir(exist_ok=True)
 
 
+# Test-name keywords that imply a marker, matched against the lowercased name
+_SLOW_NAME_PATTERN = re.compile(r'performance|benchmark')
+_PDF_NAME_PATTERN = re.compile(r'pdf|file')
+_NETWORK_NAME_PATTERN = re.compile(r'url|download|arxiv')
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add automatic markers."""
     for item in items:
+        name = item.name.lower()
+        
         # Mark slow tests
-        if "slow" in item.keywords or any(marker in item.name.lower() 
-                                         for marker in ["performance", "benchmark"]):
+        if "slow" in item.keywords or _SLOW_NAME_PATTERN.search(name):
             item.add_marker(pytest.mark.slow)
         
         # Mark tests requiring external resources
-        if any(keyword in item.name.lower() for keyword in ["pdf", "file"]):
+        if _PDF_NAME_PATTERN.search(name):
             item.add_marker(pytest.mark.requires_pdf)
         
-        if any(keyword in item.name.lower() for keyword in ["url", "download", "arxiv"]):
+        if _NETWORK_NAME_PATTERN.search(name):
             item.add_marker(pytest.mark.requires_network)
 
 
@@ -5,21 +5,55 @@ Integration tests for Paper2Data parser package.
 Tests the overall package structure and cross-module integration.
 """
 
+import os
 import sys
+import tempfile
+import importlib.util
+from functools import lru_cache
 import pytest
 from pathlib import Path
 
-# Add the parser package to the path for testing
-parser_src = Path(__file__).parent.parent / "packages" / "parser" / "src"
-sys.path.insert(0, str(parser_src))
+# Parser modules are loaded straight from their files, once per interpreter,
+# instead of prepending the source tree to sys.path
+_PARSER_SRC = Path(__file__).parent.parent / "packages" / "parser" / "src"
+_PACKAGE_DIR = _PARSER_SRC / "paper2data"
+
+
+def _exec_from_file(qualified_name, path, **spec_options):
+    """Execute a source file as module qualified_name, unregistering it on failure."""
+    spec = importlib.util.spec_from_file_location(qualified_name, path, **spec_options)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(qualified_name, None)
+        raise
+    return module
+
+
+@lru_cache(maxsize=None)
+def _load(name):
+    """Import paper2data.<name> from its source file, caching the module object."""
+    path = _PACKAGE_DIR / f"{name}.py"
+    if not path.is_file():
+        raise ImportError(f"No module named {name!r} in {_PACKAGE_DIR}")
+    if "paper2data" not in sys.modules:
+        # Relative imports inside the module resolve against the package
+        _exec_from_file("paper2data", _PACKAGE_DIR / "__init__.py",
+                        submodule_search_locations=[str(_PACKAGE_DIR)])
+    qualified_name = f"paper2data.{name}"
+    if qualified_name in sys.modules:
+        return sys.modules[qualified_name]
+    return _exec_from_file(qualified_name, path)
 
 def test_package_imports():
     """Test that all main package modules can be imported."""
     try:
         # Test individual module imports
-        import ingest
-        import extractor
-        import utils
+        ingest = _load("ingest")
+        extractor = _load("extractor")
+        utils = _load("utils")
         
         print("✅ All parser modules imported successfully")
         
@@ -40,44 +74,58 @@ def test_package_structure():
     """Test that the package structure is correct."""
     parser_dir = Path(__file__).parent.parent / "packages" / "parser"
     
-    # Check required files exist
-    required_files = [
+    # Check required files exist, listing each directory once rather than
+    # stat-ing every file
+    required_files = frozenset({
         "src/__init__.py",
         "src/ingest.py", 
         "src/extractor.py",
         "src/utils.py",
         "tests/test_parser.py",
         "pyproject.toml"
-    ]
+    })
+    
+    found = set()
+    for directory in {Path(file_path).parent for file_path in required_files}:
+        try:
+            with os.scandir(parser_dir / directory) as entries:
+                found.update((directory / entry.name).as_posix() for entry in entries if entry.is_file())
+        except FileNotFoundError:
+            continue
     
-    for file_path in required_files:
-        full_path = parser_dir / file_path
-        assert full_path.exists(), f"Required file missing: {file_path}"
+    missing = required_files - found
+    assert not missing, f"Required files missing: {sorted(missing)}"
     
     print("✅ Parser package structure is correct")
 
 
 def test_placeholder_functionality():
-    """Test that placeholder methods raise NotImplementedError as expected."""
-    import ingest
-    import extractor
-    import utils
+    """Test that the remaining placeholders raise NotImplementedError as expected."""
+    ingest = _load("ingest")
+    extractor = _load("extractor")
+    utils = _load("utils")
     
     # Test ingest placeholders
-    pdf_ingestor = ingest.PDFIngestor("test.pdf")
+    base_ingestor = ingest.BaseIngestor("test.pdf")
     with pytest.raises(NotImplementedError):
-        pdf_ingestor.validate()
+        base_ingestor.validate()
     with pytest.raises(NotImplementedError):
-        pdf_ingestor.ingest()
+        base_ingestor.ingest()
     
     # Test extractor placeholders
-    content_extractor = extractor.ContentExtractor(b"test")
+    base_extractor = extractor.BaseExtractor(b"test")
     with pytest.raises(NotImplementedError):
-        content_extractor.extract()
+        base_extractor.extract()
     
     # Test utils placeholders
     with pytest.raises(NotImplementedError):
-        utils.setup_logging()
+        utils.extract_filename_from_url("https://example.com/paper.pdf")
+    
+    # File hashing is implemented now
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sample = Path(tmp_dir) / "sample.pdf"
+        sample.write_bytes(b"test")
+        assert utils.get_file_hash(sample) == utils.get_file_hash(sample)
     
     print("✅ Placeholder functionality works as expected")
 
@@ -5,12 +5,26 @@ Comprehensive test runner for Paper2Data testing infrastructure.
 Runs all test suites, validates against golden standards, and generates reports.
 """
 
+import os
+import re
 import sys
 import json
+import io
 import time
+import timeit
+import statistics
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import subprocess
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Add parser source to path
 ROOT_DIR = Path(__file__).parent.parent
@@ -24,27 +38,81 @@ except ImportError as e:
     print("Make sure you're running from the project root and dependencies are installed.")
     sys.exit(1)
 
+# Markdown headers of any level, anchored to the start of a line so a "# "
+# inside prose or a URL fragment is not counted as a section
+_SECTION_HEADER_PATTERN = re.compile(r'(?m)^#+\s')
+
+
+class _PhaseOutput:
+    """sys.stdout stand-in that buffers each captured thread's prints separately.
+    
+    Writes from threads that are not running a captured phase pass straight
+    through to the wrapped stream.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffers: Dict[int, io.StringIO] = {}
+    
+    def capture(self, phase):
+        """Wrap a phase so it returns (result, buffered output)."""
+        def run():
+            ident = threading.get_ident()
+            buffer = self._buffers[ident] = io.StringIO()
+            try:
+                return phase(), buffer.getvalue()
+            finally:
+                del self._buffers[ident]
+        return run
+    
+    def write(self, text: str) -> int:
+        return self._buffers.get(threading.get_ident(), self._stream).write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_processor() -> TableProcessor:
+    """TableProcessor shared by every runner in this process."""
+    return TableProcessor()
+
 
 class ComprehensiveTestRunner:
     """Runs comprehensive tests and validates against golden standards."""
     
     def __init__(self):
         self.results = {}
-        self.golden_standards_dir = Path(__file__).parent / "golden_standards"
-        self.table_processor = TableProcessor()
+        # Resolved once as a plain string; standards are opened by os.path
+        self._golden_dir = os.fspath(Path(__file__).resolve().parent / "golden_standards")
         
+    @cached_property
+    def table_processor(self) -> TableProcessor:
+        """Processor for validation and benchmarks, built on first use."""
+        return _get_shared_processor()
+    
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all test suites and return comprehensive results."""
         print("🚀 Running Paper2Data Comprehensive Test Suite")
         print("=" * 60)
         
-        # Run pytest test suites
-        pytest_results = self._run_pytest_suites()
-        
-        # Validate against golden standards
-        golden_standard_results = self._validate_golden_standards()
-        
-        # Run performance benchmarks
+        # The pytest suites and golden-standard validation share no data, so
+        # they run side by side; each phase's output is buffered and printed
+        # afterwards in the usual order
+        phases = (self._run_pytest_suites, self._validate_golden_standards)
+        output = _PhaseOutput(sys.stdout)
+        with redirect_stdout(output), ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [executor.submit(output.capture(phase)) for phase in phases]
+        
+        phase_results = []
+        for future in futures:
+            result, printed = future.result()
+            sys.stdout.write(printed)
+            phase_results.append(result)
+        pytest_results, golden_standard_results = phase_results
+        
+        # Benchmarks run alone so the timings are not skewed by the pytest
+        # subprocesses
         performance_results = self._run_performance_benchmarks()
         
         # Generate comprehensive results
@@ -57,7 +125,9 @@ class ComprehensiveTestRunner:
             "pytest_results": pytest_results,
             "golden_standard_validation": golden_standard_results,
             "performance_benchmarks": performance_results,
-            "overall_status": self._calculate_overall_status()
+            "overall_status": self._calculate_overall_status(
+                pytest_results, golden_standard_results, performance_results
+            )
         }
         
         return self.results
@@ -66,67 +136,101 @@ class ComprehensiveTestRunner:
         """Run pytest test suites and collect results."""
         print("\n📋 Running pytest test suites...")
         
-        test_suites = [
+        functional_suites = [
             ("table_extraction", "tests/test_table_extraction.py::TestTableProcessor"),
             ("section_detection", "tests/test_section_detection.py::TestSectionDetectionRegression"),
-            ("performance", "tests/test_performance_benchmarks.py::TestExtractionPerformanceBenchmarks")
         ]
+        performance_suite = ("performance", "tests/test_performance_benchmarks.py::TestExtractionPerformanceBenchmarks")
+        test_suites = functional_suites + [performance_suite]
+        
+        for suite_name, _ in test_suites:
+            print(f"  Running {suite_name} tests...")
+        
+        # Each suite keeps its own pytest process; the functional suites run
+        # side by side since the threads only wait on subprocesses, while the
+        # timing-sensitive performance suite runs alone once they finish
+        with ThreadPoolExecutor(max_workers=len(functional_suites)) as executor:
+            outcomes = list(executor.map(lambda suite: self._run_pytest_suite(*suite), functional_suites))
+        outcomes.append(self._run_pytest_suite(*performance_suite))
         
         pytest_results = {}
+        for (suite_name, _), (result, message) in zip(test_suites, outcomes):
+            pytest_results[suite_name] = result
+            print(message)
         
-        for suite_name, test_path in test_suites:
-            print(f"  Running {suite_name} tests...")
+        return pytest_results
+    
+    def _run_pytest_suite(self, suite_name: str, test_path: str) -> Tuple[Dict[str, Any], str]:
+        """Run one pytest suite in a subprocess; returns its result and status line."""
+        report_file = Path(f"/tmp/pytest_{suite_name}.json")
+        try:
+            # Results come from the JSON report; the console output is
+            # discarded and only stderr is kept for startup errors
+            report_file.unlink(missing_ok=True)
+            result = subprocess.run([
+                sys.executable, "-m", "pytest", test_path, 
+                "-q", "--tb=short", "--json-report", f"--json-report-file={report_file}"
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
             
-            try:
-                result = subprocess.run([
-                    sys.executable, "-m", "pytest", test_path, 
-                    "-v", "--tb=short", "--json-report", "--json-report-file=/tmp/pytest_report.json"
-                ], capture_output=True, text=True, timeout=60)
-                
-                pytest_results[suite_name] = {
-                    "exit_code": result.returncode,
-                    "success": result.returncode == 0,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr
-                }
+            suite_result = {
+                "exit_code": result.returncode,
+                "success": result.returncode == 0,
+                "stderr": result.stderr,
+                **self._read_pytest_report(report_file)
+            }
+            
+            if result.returncode == 0:
+                return suite_result, f"    ✅ {suite_name} tests PASSED"
+            return suite_result, f"    ❌ {suite_name} tests FAILED"
                 
-                if result.returncode == 0:
-                    print(f"    ✅ {suite_name} tests PASSED")
-                else:
-                    print(f"    ❌ {suite_name} tests FAILED")
-                    
-            except subprocess.TimeoutExpired:
-                pytest_results[suite_name] = {
-                    "exit_code": -1,
-                    "success": False,
-                    "error": "Test suite timed out"
-                }
-                print(f"    ⏰ {suite_name} tests TIMED OUT")
-            except Exception as e:
-                pytest_results[suite_name] = {
-                    "exit_code": -1,
-                    "success": False,
-                    "error": str(e)
-                }
-                print(f"    💥 {suite_name} tests ERROR: {e}")
+        except subprocess.TimeoutExpired:
+            return {
+                "exit_code": -1,
+                "success": False,
+                "error": "Test suite timed out"
+            }, f"    ⏰ {suite_name} tests TIMED OUT"
+        except Exception as e:
+            return {
+                "exit_code": -1,
+                "success": False,
+                "error": str(e)
+            }, f"    💥 {suite_name} tests ERROR: {e}"
+    
+    def _read_pytest_report(self, report_file: Path) -> Dict[str, Any]:
+        """Summarize a pytest-json-report file, or return {} if there is none."""
+        try:
+            with open(report_file, 'rb') as f:
+                report = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
         
-        return pytest_results
+        return {
+            "summary": report.get("summary", {}),
+            "duration": report.get("duration"),
+            "outcomes": {test["nodeid"]: test["outcome"] for test in report.get("tests", [])}
+        }
     
     def _validate_golden_standards(self) -> Dict[str, Any]:
         """Validate current implementations against golden standards."""
         print("\n🏆 Validating against golden standards...")
         
-        validation_results = {}
+        standards = {
+            "table_extraction": ("sample_table_extraction.json", self._validate_table_extraction),
+            "section_detection": ("sample_section_detection.json", self._validate_section_detection),
+        }
         
-        # Validate table extraction
-        table_standard = self._load_golden_standard("sample_table_extraction.json")
-        if table_standard:
-            validation_results["table_extraction"] = self._validate_table_extraction(table_standard)
+        # Read every standard file at once, then report and validate in a
+        # fixed order from this thread
+        with ThreadPoolExecutor(max_workers=len(standards)) as executor:
+            loaded = list(executor.map(self._load_golden_standard,
+                                       (filename for filename, _ in standards.values())))
         
-        # Validate section detection  
-        section_standard = self._load_golden_standard("sample_section_detection.json")
-        if section_standard:
-            validation_results["section_detection"] = self._validate_section_detection(section_standard)
+        validation_results = {}
+        for (name, (_, validate)), (standard, message) in zip(standards.items(), loaded):
+            if message:
+                print(message)
+            if standard:
+                validation_results[name] = validate(standard)
         
         return validation_results
     
@@ -150,10 +254,16 @@ class ComprehensiveTestRunner:
             validation_score = 0.0
             max_score = 6.0  # Number of validation checks
             
+            # Read each field once; the checks and the summary below share them
+            result_format = result.get("format")
+            column_count = result.get("column_count")
+            row_count = result.get("row_count")
+            confidence = result.get("confidence")
+            
             checks = {
-                "format_correct": result.get("format") == expected["format"],
-                "column_count_correct": result.get("column_count") == expected["column_count"],
-                "row_count_correct": result.get("row_count") == expected["row_count"],
+                "format_correct": result_format == expected["format"],
+                "column_count_correct": column_count == expected["column_count"],
+                "row_count_correct": row_count == expected["row_count"],
                 "header_detected": result.get("header_columns") == expected["header_columns"],
                 "confidence_sufficient": result.get("confidence", 0) >= expected["min_confidence"],
                 "csv_structure_valid": self._validate_csv_structure(result, expected["csv_structure"])
@@ -174,10 +284,10 @@ class ComprehensiveTestRunner:
                 "score": final_score,
                 "detailed_checks": checks,
                 "actual_result": {
-                    "format": result.get("format"),
-                    "column_count": result.get("column_count"),
-                    "row_count": result.get("row_count"),
-                    "confidence": result.get("confidence")
+                    "format": result_format,
+                    "column_count": column_count,
+                    "row_count": row_count,
+                    "confidence": confidence
                 }
             }
             
@@ -198,7 +308,7 @@ class ComprehensiveTestRunner:
             input_data = standard["input_data"]
             
             # Simple section count validation (can be enhanced)
-            sections_found = input_data.count("# ")
+            sections_found = sum(1 for _ in _SECTION_HEADER_PATTERN.finditer(input_data))
             expected = standard["expected_output"]
             
             validation_score = 0.0
@@ -261,56 +371,68 @@ class ComprehensiveTestRunner:
         print("  📊 Benchmarking table processing...")
         sample_table = "Col1\tCol2\tCol3\nA\t1\t2.5\nB\t3\t4.7\nC\t5\t6.9"
         
-        start_time = time.perf_counter()
+        # One discarded warm-up call, then the best and median per-call time
+        # over repeated batches, which one-off jitter cannot skew
         result = self.table_processor.convert_to_csv(sample_table, "benchmark_test")
-        end_time = time.perf_counter()
+        number = 100
+        samples = [
+            total / number
+            for total in timeit.repeat(
+                lambda: self.table_processor.convert_to_csv(sample_table, "benchmark_test"),
+                number=number, repeat=7
+            )
+        ]
         
-        processing_time = end_time - start_time
+        processing_time = min(samples)
         benchmarks["table_processing"] = {
             "processing_time_seconds": processing_time,
+            "p50_time_seconds": statistics.median(samples),
+            "stdev_time_seconds": statistics.stdev(samples),
             "success": result is not None,
             "meets_performance_target": processing_time < 0.1  # 100ms target
         }
         
+        timing = (f"{processing_time * 1000:.3f}ms best, "
+                  f"{benchmarks['table_processing']['p50_time_seconds'] * 1000:.3f}ms median")
         if processing_time < 0.05:
-            print(f"    ⚡ Table processing: {processing_time:.4f}s (EXCELLENT)")
+            print(f"    ⚡ Table processing: {timing} (EXCELLENT)")
         elif processing_time < 0.1:
-            print(f"    ✅ Table processing: {processing_time:.4f}s (GOOD)")
+            print(f"    ✅ Table processing: {timing} (GOOD)")
         else:
-            print(f"    ⚠️  Table processing: {processing_time:.4f}s (SLOW)")
+            print(f"    ⚠️  Table processing: {timing} (SLOW)")
         
         return benchmarks
     
-    def _load_golden_standard(self, filename: str) -> Dict[str, Any]:
-        """Load a golden standard file."""
-        file_path = self.golden_standards_dir / filename
+    def _load_golden_standard(self, filename: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Load a golden standard file; returns the standard and any warning line."""
+        file_path = os.path.join(self._golden_dir, filename)
         
-        if not file_path.exists():
-            print(f"    ⚠️  Golden standard not found: {filename}")
-            return None
+        if not os.path.isfile(file_path):
+            return None, f"    ⚠️  Golden standard not found: {filename}"
         
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return json_loads(f.read()), None
         except Exception as e:
-            print(f"    ❌ Failed to load golden standard {filename}: {e}")
-            return None
+            return None, f"    ❌ Failed to load golden standard {filename}: {e}"
     
-    def _calculate_overall_status(self) -> Dict[str, Any]:
-        """Calculate overall test status."""
+    def _calculate_overall_status(self, pytest_results: Dict[str, Any],
+                                  golden_standard_results: Dict[str, Any],
+                                  performance_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate overall test status from the results of each phase."""
         pytest_success = all(
-            result.get("success", False) 
-            for result in self.results.get("pytest_results", {}).values()
+            result.get("success", False)
+            for result in pytest_results.values()
         )
         
         golden_standard_success = all(
             result.get("success", False)
-            for result in self.results.get("golden_standard_validation", {}).values()
+            for result in golden_standard_results.values()
         )
         
         performance_success = all(
             result.get("meets_performance_target", False)
-            for result in self.results.get("performance_benchmarks", {}).values()
+            for result in performance_results.values()
         )
         
         overall_success = pytest_success and golden_standard_success and performance_success
@@ -327,54 +449,51 @@ class ComprehensiveTestRunner:
         if not self.results:
             return "No test results available. Run tests first."
         
-        report_lines = [
-            "# Paper2Data Comprehensive Test Report",
-            f"Generated: {self.results['test_session_info']['timestamp']}",
-            "",
-            "## Overall Status",
-        ]
+        # Lines go straight into one buffer instead of a list joined at the end
+        buf = io.StringIO()
+        w = buf.write
+        
+        w("# Paper2Data Comprehensive Test Report\n")
+        w(f"Generated: {self.results['test_session_info']['timestamp']}\n")
+        w("\n")
+        w("## Overall Status\n")
         
         overall = self.results["overall_status"]
         if overall["overall_success"]:
-            report_lines.append("🎉 **ALL TESTS PASSING** - System is ready for production!")
+            w("🎉 **ALL TESTS PASSING** - System is ready for production!\n")
         else:
-            report_lines.append("⚠️  **TESTS FAILING** - Issues detected that need attention")
+            w("⚠️  **TESTS FAILING** - Issues detected that need attention\n")
         
-        report_lines.extend([
-            "",
-            f"- Pytest Suites: {'✅ PASS' if overall['pytest_success'] else '❌ FAIL'}",
-            f"- Golden Standards: {'✅ PASS' if overall['golden_standard_success'] else '❌ FAIL'}",
-            f"- Performance: {'✅ PASS' if overall['performance_success'] else '❌ FAIL'}",
-            "",
-            "## Test Suite Results"
-        ])
+        w("\n")
+        w(f"- Pytest Suites: {'✅ PASS' if overall['pytest_success'] else '❌ FAIL'}\n")
+        w(f"- Golden Standards: {'✅ PASS' if overall['golden_standard_success'] else '❌ FAIL'}\n")
+        w(f"- Performance: {'✅ PASS' if overall['performance_success'] else '❌ FAIL'}\n")
+        w("\n")
+        w("## Test Suite Results\n")
         
         # Add detailed results
         for suite_name, result in self.results["pytest_results"].items():
             status = "✅ PASS" if result["success"] else "❌ FAIL"
-            report_lines.append(f"- **{suite_name}**: {status}")
+            w(f"- **{suite_name}**: {status}\n")
         
-        report_lines.extend([
-            "",
-            "## Golden Standard Validation"
-        ])
+        w("\n")
+        w("## Golden Standard Validation\n")
         
         for standard_name, result in self.results["golden_standard_validation"].items():
             status = "✅ PASS" if result["success"] else "❌ FAIL"
             score = result.get("score", 0.0)
-            report_lines.append(f"- **{standard_name}**: {status} (Score: {score:.2f})")
+            w(f"- **{standard_name}**: {status} (Score: {score:.2f})\n")
         
-        report_lines.extend([
-            "",
-            "## Performance Benchmarks"
-        ])
+        w("\n")
+        w("## Performance Benchmarks\n")
         
         for benchmark_name, result in self.results["performance_benchmarks"].items():
             status = "✅ GOOD" if result["meets_performance_target"] else "⚠️ SLOW"
             time_val = result.get("processing_time_seconds", 0)
-            report_lines.append(f"- **{benchmark_name}**: {status} ({time_val:.4f}s)")
+            w(f"- **{benchmark_name}**: {status} ({time_val:.4f}s)\n")
         
-        report = "\n".join(report_lines)
+        # Drop the final newline, matching the previous line-joined layout
+        report = buf.getvalue()[:-1]
         
         if output_file:
             with open(output_file, 'w') as f: